@@ -0,0 +1,79 @@
+import gc
+import threading
+
+
+class SentimentAnalyzer:
+    """
+    Оценка тональности английского текста по словарю TextBlob.
+
+    TextBlob(text).sentiment для каждого текста создает объект TextBlob
+    с моделями и новый класс namedtuple, а словарь тональности
+    загружает при первом вызове. Анализатор загружает словарь один раз
+    при создании и вызывает его напрямую для строки; результат совпадает
+    с TextBlob(text).sentiment.
+
+    Загруженный анализатор можно создать до запуска пула процессов
+    (см. prefork), тогда при запуске через fork рабочие процессы
+    разделяют словарь с родителем по принципу копирования при записи.
+    """
+
+    def __init__(self, warm=True):
+        """
+        Args:
+            warm (bool): Загрузить словарь тональности сразу.
+        """
+        from textblob.en import sentiment
+
+        self.lexicon = sentiment
+        if warm:
+            self.warm()
+
+    def warm(self):
+        """Загружает словарь тональности и прогревает токенизатор."""
+        len(self.lexicon)
+        self.lexicon('good')
+
+    def score(self, text):
+        """
+        Оценивает полярность и субъективность текста.
+
+        Args:
+            text (str): Текст на английском языке.
+
+        Returns:
+            tuple[float, float]: Полярность и субъективность.
+        """
+        polarity, subjectivity = self.lexicon(text)
+        return polarity, subjectivity
+
+
+default_analyzer = None
+analyzer_lock = threading.Lock()
+
+
+def get_analyzer():
+    """
+    Возвращает общий загруженный анализатор, создавая его при первом
+    вызове.
+
+    Returns:
+        SentimentAnalyzer: Анализатор.
+    """
+    global default_analyzer
+    if default_analyzer is None:
+        with analyzer_lock:
+            if default_analyzer is None:
+                default_analyzer = SentimentAnalyzer()
+    return default_analyzer
+
+
+def prefork():
+    """
+    Готовит анализатор к разделению между рабочими процессами.
+
+    Вызывается в родительском процессе перед созданием пула: загружает
+    словарь и замораживает сборщик мусора, чтобы он не обходил объекты
+    словаря в дочерних процессах и не копировал их страницы памяти.
+    """
+    get_analyzer()
+    gc.freeze()
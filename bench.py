@@ -0,0 +1,284 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import main
+import ru_local as ru
+
+
+SIZES = (10, 1000, 100000, 10000000, 100000000)
+SENTIMENT_LIMIT = 1000000
+MIN_DURATION = 0.2
+MAX_REPEATS = 1000
+IMPORT_MODULES = ('main', 'bulk', 'server', 'streaming', 'incremental')
+IMPORT_REPEATS = 5
+# Модули, которые не должны загружаться при импорте: они нужны только
+# для перевода и оценки тональности.
+HEAVY_MODULES = ('deep_translator', 'textblob', 'nltk', 'requests')
+
+WORDS = {
+    'RU': ('текст', 'читать', 'хороший', 'плохой', 'простой', 'сложный',
+           'книга', 'день', 'человек', 'работа', 'вопрос', 'ответ',
+           'очень', 'быстро', 'медленно', 'и', 'в', 'на', 'не'),
+    'ENG': ('text', 'read', 'good', 'bad', 'simple', 'difficult', 'book',
+            'day', 'person', 'work', 'question', 'answer', 'very',
+            'quickly', 'slowly', 'and', 'in', 'on', 'not'),
+}
+
+FUNCTIONS = (
+    ('count_words', main.count_words),
+    ('count_vowels', main.count_vowels),
+    ('count_sentences', main.count_sentences),
+    ('detect_language', main.detect_language),
+    ('fre_index', main.fre_index),
+    ('reading_difficulty', main.reading_difficulty),
+    ('analyze_sentiment', main.analyze_sentiment),
+)
+
+
+class StubTranslator:
+    """
+    Локальная замена GoogleTranslator с настраиваемой задержкой,
+    которая возвращает текст без изменений.
+    """
+
+    latency = 0.0
+
+    def __init__(self, source='auto', target='en'):
+        self.source = source
+        self.target = target
+
+    def translate(self, text, **kwargs):
+        """Возвращает текст без изменений после заданной задержки."""
+        if self.latency:
+            time.sleep(self.latency)
+        return text
+
+
+def make_corpus(language, size, seed=0):
+    """
+    Создает синтетический текст заданного размера.
+
+    Args:
+        language (str): Язык текста (RU или ENG).
+        size (int): Размер текста в байтах UTF-8.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        str: Текст, размер которого в UTF-8 не превышает size байт.
+    """
+    rng = random.Random(seed)
+    words = WORDS[language]
+    parts = []
+    length = 0
+
+    while length < size:
+        sentence = ' '.join(rng.choice(words)
+                            for _ in range(rng.randint(4, 16)))
+        sentence = sentence.capitalize() + rng.choice('..!?') + ' '
+        parts.append(sentence)
+        length += len(sentence.encode('utf-8'))
+
+    text = ''.join(parts).encode('utf-8')[:size]
+    return text.decode('utf-8', errors='ignore')
+
+
+def measure(function, text):
+    """
+    Измеряет время работы и пиковый объем памяти функции.
+
+    Функция вызывается повторно, пока суммарное время не превысит
+    MIN_DURATION; берется лучший результат. Первый вызов не учитывается:
+    он загружает переводчик и TextBlob. Память измеряется отдельным
+    запуском под tracemalloc, чтобы не искажать время.
+
+    Args:
+        function (Callable[[str], object]): Функция для измерения.
+        text (str): Входной текст.
+
+    Returns:
+        tuple[float, int, int]: Лучшее время в секундах, число запусков
+            и пиковый объем памяти в байтах.
+    """
+    best = float('inf')
+    total = 0.0
+    repeats = 0
+
+    function(text)
+    while total < MIN_DURATION and repeats < MAX_REPEATS:
+        start = time.perf_counter()
+        function(text)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeats += 1
+
+    tracemalloc.start()
+    try:
+        function(text)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, repeats, peak
+
+
+def run_benchmarks(sizes=SIZES, latency=0.0,
+                   sentiment_limit=SENTIMENT_LIMIT, functions=None):
+    """
+    Запускает измерения для всех функций, языков и размеров текста.
+
+    Args:
+        sizes (Iterable[int]): Размеры текстов в байтах.
+        latency (float): Задержка заглушки переводчика в секундах.
+        sentiment_limit (int): Максимальный размер текста для
+            analyze_sentiment.
+        functions (Iterable[str] | None): Имена функций; None означает все.
+
+    Returns:
+        list[dict]: Результаты измерений.
+    """
+    main.translator_factory = StubTranslator
+    main.reset_translators()
+    StubTranslator.latency = latency
+    main.set_translation_cache(None)
+
+    results = []
+    for language in WORDS:
+        for size in sizes:
+            text = make_corpus(language, size)
+            nbytes = len(text.encode('utf-8'))
+
+            for name, function in FUNCTIONS:
+                if functions and name not in functions:
+                    continue
+                if name == 'analyze_sentiment' and size > sentiment_limit:
+                    continue
+
+                seconds, repeats, peak = measure(function, text)
+                results.append({
+                    "function": name,
+                    "language": language,
+                    "bytes": nbytes,
+                    "repeats": repeats,
+                    "seconds": seconds,
+                    "mb_per_s": nbytes / seconds / 1e6 if seconds else None,
+                    "docs_per_s": 1 / seconds if seconds else None,
+                    "peak_memory_bytes": peak,
+                })
+    return results
+
+
+def measure_import(module, repeats=IMPORT_REPEATS):
+    """
+    Измеряет время импорта модуля в отдельном интерпретаторе.
+
+    Используется вывод python -X importtime; берется лучший из repeats
+    запусков.
+
+    Args:
+        module (str): Имя модуля.
+        repeats (int): Количество запусков.
+
+    Returns:
+        tuple[float, list[str]]: Время импорта в секундах и загруженные
+            при этом модули из HEAVY_MODULES.
+    """
+    best = float('inf')
+    heavy = set()
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)))
+        for line in completed.stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) != 3:
+                continue
+            name = parts[2].strip()
+            if name == module:
+                best = min(best, int(parts[1]) / 1e6)
+            elif name in HEAVY_MODULES:
+                heavy.add(name)
+    return best, sorted(heavy)
+
+
+def run_import_benchmarks(modules=IMPORT_MODULES, repeats=IMPORT_REPEATS):
+    """
+    Измеряет время импорта модулей проекта.
+
+    Args:
+        modules (Iterable[str]): Имена модулей.
+        repeats (int): Количество запусков для каждого модуля.
+
+    Returns:
+        list[dict]: Результаты измерений.
+    """
+    results = []
+    for module in modules:
+        seconds, heavy = measure_import(module, repeats)
+        results.append({
+            "module": module,
+            "seconds": seconds,
+            "heavy_modules": heavy,
+        })
+    return results
+
+
+def run(argv=None):
+    """
+    Точка входа командной строки: python bench.py.
+
+    Args:
+        argv (list[str] | None): Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(prog='bench',
+                                     description=ru.BENCH_DESCRIPTION)
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=SIZES,
+                        help=ru.BENCH_SIZES)
+    parser.add_argument('-l', '--latency', type=float, default=0.0,
+                        help=ru.BENCH_LATENCY)
+    parser.add_argument('--sentiment-limit', type=int,
+                        default=SENTIMENT_LIMIT, help=ru.BENCH_SENTIMENT_LIMIT)
+    parser.add_argument('-f', '--functions', nargs='+',
+                        help=ru.BENCH_FUNCTIONS)
+    parser.add_argument('-o', '--output', help=ru.BULK_OUTPUT)
+    parser.add_argument('--imports', action='store_true',
+                        help=ru.BENCH_IMPORTS)
+    parser.add_argument('--import-budget', type=float,
+                        help=ru.BENCH_IMPORT_BUDGET)
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "translator_latency": args.latency,
+    }
+    if args.imports or args.import_budget is not None:
+        report["imports"] = run_import_benchmarks()
+    else:
+        report["results"] = run_benchmarks(args.sizes, args.latency,
+                                           args.sentiment_limit,
+                                           args.functions)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.import_budget is not None:
+        for entry in report["imports"]:
+            if entry["heavy_modules"] \
+                    or entry["seconds"] * 1e3 > args.import_budget:
+                sys.exit(ru.BENCH_IMPORT_OVER.format(**entry))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,342 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import csv
+import json
+import os
+import sys
+from analyzer import prefork
+from cache import ResultStore
+from main import (analyze_text, analyze_texts, offline_backend,
+                  readability, set_result_store)
+import ru_local as ru
+from streaming import mmap_stats
+
+
+TEXT_EXTENSIONS = ('.txt', '.md')
+DOCUMENT_EXTENSIONS = TEXT_EXTENSIONS + ('.jsonl', '.csv')
+PARQUET_FIELDS = (
+    ('id', 'string'),
+    ('sentiment', 'string'),
+    ('polarity', 'float64'),
+    ('subjectivity', 'float64'),
+    ('objectivity_percent', 'float64'),
+    ('subjectivity_percent', 'float64'),
+    ('words', 'int64'),
+    ('vowels', 'int64'),
+    ('sentences', 'int64'),
+    ('language', 'string'),
+    ('fre_index', 'float64'),
+    ('difficulty', 'string'),
+    ('error', 'string'),
+)
+
+worker_store = None
+
+
+class TextFile:
+    """
+    Текстовый файл, который рабочий процесс анализирует сам через
+    streaming.mmap_stats, не загружая его в одну строку.
+
+    Attributes:
+        path (str): Путь к файлу.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+
+def read_documents(paths, field='text', read_text=True):
+    """
+    Читает документы из файлов, каталогов, JSONL и CSV.
+
+    Каждая строка JSONL или CSV дает отдельный документ, любой другой
+    явно указанный файл считается одним текстовым документом. Каталоги
+    обходятся рекурсивно, из них берутся только файлы с расширениями
+    DOCUMENT_EXTENSIONS.
+
+    Args:
+        paths (list[str]): Пути к источникам; '-' означает стандартный
+            ввод в формате JSONL.
+        field (str): Имя поля с текстом в JSONL и CSV.
+        read_text (bool): Читать текстовые файлы в строку; если False,
+            вместо текста возвращается TextFile.
+
+    Yields:
+        tuple[str, str | TextFile | None | ValueError]: Пары
+            (идентификатор, текст); None, если в записи нет поля
+            с текстом, и ValueError, если строку JSONL не удалось
+            разобрать.
+    """
+    for path in paths:
+        if path == '-':
+            yield from read_jsonl(sys.stdin, '-', field)
+        elif os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith(DOCUMENT_EXTENSIONS):
+                        yield from read_documents(
+                            [os.path.join(root, name)], field, read_text)
+        elif path.endswith('.jsonl'):
+            with open(path, encoding='utf-8') as file:
+                yield from read_jsonl(file, path, field)
+        elif path.endswith('.csv'):
+            with open(path, encoding='utf-8', newline='') as file:
+                for number, row in enumerate(csv.DictReader(file)):
+                    yield row.get('id') or f"{path}:{number}", row.get(field)
+        elif not read_text:
+            yield path, TextFile(path)
+        else:
+            with open(path, encoding='utf-8') as file:
+                yield path, file.read()
+
+
+def read_jsonl(file, name, field):
+    """
+    Читает документы из потока JSONL.
+
+    Строка, которая не разбирается как JSON-объект, не прерывает
+    чтение: вместо текста для нее возвращается ValueError.
+
+    Args:
+        file: Открытый текстовый поток.
+        name (str): Имя источника для идентификаторов.
+        field (str): Имя поля с текстом.
+
+    Yields:
+        tuple[str, str | None | ValueError]: Пары (идентификатор, текст).
+    """
+    for number, line in enumerate(file):
+        if not line.strip():
+            continue
+        doc_id = f"{name}:{number}"
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield doc_id, ValueError(ru.BULK_BAD_JSON.format(error))
+            continue
+        if not isinstance(record, dict):
+            yield doc_id, ValueError(ru.BULK_NOT_OBJECT)
+            continue
+        yield str(record.get('id', doc_id)), record.get(field)
+
+
+def chunked(documents, size):
+    """
+    Разбивает поток документов на пакеты.
+
+    Args:
+        documents (Iterable): Поток документов.
+        size (int): Размер пакета.
+
+    Yields:
+        list: Очередной пакет.
+    """
+    chunk = []
+    for document in documents:
+        chunk.append(document)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def init_worker(store, sentiment):
+    """
+    Готовит рабочий процесс: подключает хранилище результатов и
+    загружает анализатор тональности, если он не унаследован
+    от родительского процесса.
+
+    Args:
+        store (str | None): Путь к хранилищу результатов.
+        sentiment (bool): Нужно ли оценивать тональность.
+    """
+    global worker_store
+    if store:
+        worker_store = ResultStore(store)
+        set_result_store(worker_store)
+    if sentiment:
+        prefork()
+
+
+def analyze_chunk(chunk, sentiment=True, backend=None):
+    """
+    Анализирует пакет документов в рабочем процессе. Новые результаты
+    записываются в хранилище одной транзакцией на пакет.
+
+    Тональность всего пакета оценивается одним вызовом analyze_texts,
+    поэтому переводы упаковываются в минимальное число запросов. Если
+    пакетный анализ завершился ошибкой, документы анализируются
+    по одному, и ошибка одного документа не прерывает обработку
+    остальных: для него возвращается запись с полями id и error.
+
+    Метрики документов TextFile считаются по файлу, отображенному
+    в память (см. streaming.mmap_stats), без тональности и без
+    хранилища результатов.
+
+    Args:
+        chunk (list[tuple[str, str | TextFile | None | ValueError]]): Пары
+            (идентификатор, текст) из read_documents.
+        sentiment (bool): Нужно ли оценивать тональность.
+        backend (Callable | None): Способ оценки тональности.
+
+    Returns:
+        list[dict]: Результаты анализа или записи об ошибках с полем id.
+    """
+    results = [{"id": doc_id} for doc_id, _ in chunk]
+    valid = []
+    for position, (_, text) in enumerate(chunk):
+        if isinstance(text, str):
+            valid.append(position)
+        elif isinstance(text, TextFile):
+            try:
+                results[position].update(readability(mmap_stats(text.path)))
+            except (OSError, ValueError) as error:
+                results[position]["error"] = str(error)
+        elif isinstance(text, ValueError):
+            results[position]["error"] = str(text)
+        else:
+            results[position]["error"] = ru.BULK_NOT_TEXT
+
+    texts = [chunk[position][1] for position in valid]
+    try:
+        analyzed = analyze_texts(texts, sentiment, backend)
+    except Exception:
+        analyzed = []
+        for text in texts:
+            try:
+                analyzed.append(analyze_text(text, sentiment, backend))
+            except Exception as error:
+                analyzed.append({"error": str(error)})
+
+    for position, result in zip(valid, analyzed):
+        results[position].update(result)
+    if worker_store is not None:
+        worker_store.flush()
+    return results
+
+
+def analyze_corpus(documents, workers=None, chunk_size=256, sentiment=True,
+                   backend=None, store=None):
+    """
+    Распределяет документы по процессам и возвращает результаты
+    в исходном порядке по мере готовности.
+
+    Анализатор тональности загружается до запуска процессов, поэтому
+    при запуске через fork они разделяют его словарь с родителем.
+
+    Args:
+        documents (Iterable[tuple[str, str]]): Пары (идентификатор, текст).
+        workers (int | None): Количество процессов.
+        chunk_size (int): Количество документов в одном пакете.
+        sentiment (bool): Нужно ли оценивать тональность.
+        backend (Callable | None): Способ оценки тональности.
+        store (str | None): Путь к хранилищу результатов; документы,
+            проанализированные ранее, берутся из него.
+
+    Yields:
+        list[dict]: Результаты анализа очередного пакета.
+    """
+    workers = workers or os.cpu_count() or 1
+    if sentiment:
+        prefork()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(store, sentiment)) as executor:
+        pending = deque()
+        for chunk in chunked(documents, chunk_size):
+            pending.append(executor.submit(analyze_chunk, chunk,
+                                           sentiment, backend))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_jsonl(batches, file):
+    """
+    Записывает результаты в формате JSONL.
+
+    Args:
+        batches (Iterable[list[dict]]): Пакеты результатов.
+        file: Открытый текстовый поток.
+    """
+    for batch in batches:
+        for result in batch:
+            file.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+
+def write_parquet(batches, path):
+    """
+    Записывает результаты в столбцовом формате Parquet, по одной
+    группе строк на пакет.
+
+    Схема файла постоянна (PARQUET_FIELDS): поля, отсутствующие
+    в записи, например тональность при --no-sentiment или метрики
+    в записи об ошибке, записываются пустыми значениями.
+
+    Args:
+        batches (Iterable[list[dict]]): Пакеты результатов.
+        path (str): Путь к выходному файлу.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        sys.exit(ru.BULK_NO_PARQUET)
+
+    schema = pyarrow.schema([(name, getattr(pyarrow, type_name)())
+                             for name, type_name in PARQUET_FIELDS])
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            writer.write_table(pyarrow.Table.from_pylist(batch, schema))
+
+
+def run(argv=None):
+    """
+    Точка входа командной строки: python -m bulk.
+
+    Args:
+        argv (list[str] | None): Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(prog='bulk',
+                                     description=ru.BULK_DESCRIPTION)
+    parser.add_argument('inputs', nargs='+', help=ru.BULK_INPUTS)
+    parser.add_argument('-o', '--output', help=ru.BULK_OUTPUT)
+    parser.add_argument('-f', '--format', choices=('jsonl', 'parquet'),
+                        default='jsonl', help=ru.BULK_FORMAT)
+    parser.add_argument('-w', '--workers', type=int, help=ru.BULK_WORKERS)
+    parser.add_argument('-c', '--chunk-size', type=int, default=256,
+                        help=ru.BULK_CHUNK_SIZE)
+    parser.add_argument('--field', default='text', help=ru.BULK_FIELD)
+    parser.add_argument('--no-sentiment', action='store_true',
+                        help=ru.BULK_NO_SENTIMENT)
+    parser.add_argument('--offline', action='store_true',
+                        help=ru.BULK_OFFLINE)
+    parser.add_argument('--store', help=ru.BULK_STORE)
+    args = parser.parse_args(argv)
+
+    if args.format == 'parquet' and not args.output:
+        parser.error(ru.BULK_PARQUET_OUTPUT)
+
+    # Без тональности текстовым файлам нужны только метрики, и рабочие
+    # процессы считают их по файлу, отображенному в память.
+    documents = read_documents(args.inputs, args.field,
+                               read_text=not args.no_sentiment)
+    backend = offline_backend if args.offline else None
+    batches = analyze_corpus(documents, args.workers, args.chunk_size,
+                             not args.no_sentiment, backend, args.store)
+
+    if args.format == 'parquet':
+        write_parquet(batches, args.output)
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            write_jsonl(batches, file)
+    else:
+        write_jsonl(batches, sys.stdout)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,358 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+def text_key(text):
+    """
+    Вычисляет ключ кэша для текста.
+
+    Args:
+        text (str): Исходный текст.
+
+    Returns:
+        str: SHA-256 хэш текста в шестнадцатеричном виде.
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """
+    Постоянный кэш переводов на основе SQLite.
+
+    Ключом служит тройка (хэш текста, исходный язык, целевой язык).
+    Устаревшие записи удаляются по TTL, а при превышении max_entries
+    вытесняются записи, к которым дольше всего не обращались (LRU).
+    Вытеснение выполняется пакетно, раз в evict_every записей, чтобы
+    не сканировать таблицу при каждой вставке.
+
+    Время обращения обновляется не чаще раза в touch_interval секунд
+    для записи, а обновления накапливаются в памяти и записываются одной
+    транзакцией при вставке, вытеснении, вызове flush, stats и close или
+    после touch_every обновлений, поэтому попадание обычно обходится
+    одним SELECT без записи в базу.
+
+    Attributes:
+        hits (int): Количество попаданий в кэш.
+        misses (int): Количество промахов.
+    """
+
+    def __init__(self, path=':memory:', max_entries=100000, ttl=None,
+                 evict_every=1000, touch_interval=60.0, touch_every=256):
+        """
+        Args:
+            path (str): Путь к файлу базы данных.
+            max_entries (int | None): Максимальное число записей.
+            ttl (float | None): Время жизни записи в секундах.
+            evict_every (int): Через сколько вставок запускать вытеснение.
+            touch_interval (float): Через сколько секунд после прошлого
+                обновления снова обновлять время обращения к записи.
+            touch_every (int): Через сколько накопленных обновлений
+                времени обращения записывать их в базу.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evict_every = evict_every
+        self.touch_interval = touch_interval
+        self.touch_every = touch_every
+        self._writes = 0
+        self._touched = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' key TEXT NOT NULL,'
+            ' source TEXT NOT NULL,'
+            ' target TEXT NOT NULL,'
+            ' translation TEXT NOT NULL,'
+            ' created REAL NOT NULL,'
+            ' accessed REAL NOT NULL,'
+            ' PRIMARY KEY (key, source, target))'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS translations_accessed'
+            ' ON translations (accessed)'
+        )
+        self._conn.commit()
+
+    def get(self, text, source, target):
+        """
+        Ищет перевод в кэше.
+
+        Args:
+            text (str): Исходный текст.
+            source (str): Исходный язык.
+            target (str): Целевой язык.
+
+        Returns:
+            str | None: Перевод или None, если его нет в кэше.
+        """
+        key = text_key(text)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT translation, created, accessed FROM translations'
+                ' WHERE key = ? AND source = ? AND target = ?',
+                (key, source, target),
+            ).fetchone()
+
+            if row is not None and self.ttl is not None \
+                    and now - row[1] > self.ttl:
+                self._touched.pop((key, source, target), None)
+                self._conn.execute(
+                    'DELETE FROM translations'
+                    ' WHERE key = ? AND source = ? AND target = ?',
+                    (key, source, target),
+                )
+                self._conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            if now - row[2] >= self.touch_interval:
+                self._touched[(key, source, target)] = now
+                if len(self._touched) >= self.touch_every:
+                    self._touch()
+                    self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, text, source, target, translation):
+        """
+        Сохраняет перевод в кэше.
+
+        Args:
+            text (str): Исходный текст.
+            source (str): Исходный язык.
+            target (str): Целевой язык.
+            translation (str): Перевод.
+        """
+        now = time.time()
+        key = (text_key(text), source, target)
+        with self._lock:
+            self._touched.pop(key, None)
+            self._touch()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translations'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (*key, translation, now, now),
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def _touch(self):
+        """
+        Записывает накопленные времена обращения без фиксации транзакции.
+        Вызывается под блокировкой.
+        """
+        if not self._touched:
+            return
+        self._conn.executemany(
+            'UPDATE translations SET accessed = ?'
+            ' WHERE key = ? AND source = ? AND target = ?',
+            [(accessed, *key) for key, accessed in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def flush(self):
+        """Записывает накопленные времена обращения в базу данных."""
+        with self._lock:
+            self._touch()
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self._conn.execute(
+                'DELETE FROM translations WHERE created < ?',
+                (now - self.ttl,),
+            )
+
+        if self.max_entries is not None:
+            self._conn.execute(
+                'DELETE FROM translations WHERE rowid IN ('
+                ' SELECT rowid FROM translations'
+                ' ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+    def stats(self):
+        """
+        Возвращает счетчики кэша.
+
+        Returns:
+            dict: Попадания, промахи, доля попаданий и размер кэша.
+        """
+        with self._lock:
+            self._touch()
+            self._conn.commit()
+            size = self._conn.execute(
+                'SELECT COUNT(*) FROM translations'
+            ).fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size,
+        }
+
+    def clear(self):
+        """Удаляет все записи и сбрасывает счетчики."""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute('DELETE FROM translations')
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Записывает времена обращения и закрывает соединение."""
+        with self._lock:
+            self._touch()
+            self._conn.commit()
+            self._conn.close()
+
+
+def result_key(text, version, options=''):
+    """
+    Вычисляет ключ результата анализа по содержимому текста.
+
+    Текст не нормализуется: метрики зависят от формы Unicode и
+    пробельных символов, поэтому разные тексты дают разные ключи.
+
+    Args:
+        text (str): Исходный текст.
+        version (str): Версия анализатора.
+        options (str): Параметры анализа, влияющие на результат.
+
+    Returns:
+        str: SHA-256 хэш в шестнадцатеричном виде.
+    """
+    return text_key(f"{version}\0{options}\0{text}")
+
+
+class ResultStore:
+    """
+    Постоянное хранилище полных результатов анализа на основе SQLite.
+
+    Ключ адресует содержимое: хэш текста, версии анализатора и
+    параметров анализа, поэтому повторный анализ неизменного документа
+    сводится к поиску, а смена версии анализатора делает старые записи
+    недоступными.
+
+    Новые записи накапливаются в памяти и записываются одной транзакцией
+    раз в commit_every записей, при вызове flush и при закрытии.
+
+    Attributes:
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов.
+    """
+
+    def __init__(self, path=':memory:', commit_every=256):
+        """
+        Args:
+            path (str): Путь к файлу базы данных.
+            commit_every (int): Через сколько записей сохранять их в базу.
+        """
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30,
+                                     check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            ' key TEXT PRIMARY KEY,'
+            ' result TEXT NOT NULL,'
+            ' created REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """
+        Ищет результат анализа.
+
+        Args:
+            key (str): Ключ из result_key.
+
+        Returns:
+            dict | None: Результат или None, если его нет.
+        """
+        with self._lock:
+            data = self._pending.get(key)
+            if data is None:
+                row = self._conn.execute(
+                    'SELECT result FROM results WHERE key = ?', (key,)
+                ).fetchone()
+                data = row and row[0]
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(data)
+
+    def set(self, key, result):
+        """
+        Сохраняет результат анализа.
+
+        Args:
+            key (str): Ключ из result_key.
+            result (dict): Результат анализа.
+        """
+        data = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._pending[key] = data
+            if len(self._pending) >= self.commit_every:
+                self._write()
+
+    def _write(self):
+        """Записывает накопленные записи. Вызывается под блокировкой."""
+        if not self._pending:
+            return
+        now = time.time()
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?)',
+            [(key, data, now) for key, data in self._pending.items()],
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def flush(self):
+        """Записывает накопленные записи в базу данных."""
+        with self._lock:
+            self._write()
+
+    def stats(self):
+        """
+        Возвращает счетчики хранилища.
+
+        Returns:
+            dict: Попадания, промахи, доля попаданий и размер хранилища.
+        """
+        with self._lock:
+            self._write()
+            size = self._conn.execute(
+                'SELECT COUNT(*) FROM results'
+            ).fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size,
+        }
+
+    def close(self):
+        """Записывает накопленные записи и закрывает соединение."""
+        with self._lock:
+            self._write()
+            self._conn.close()
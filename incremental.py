@@ -0,0 +1,441 @@
+from bisect import bisect_right
+from itertools import accumulate
+import re
+from main import (LANGUAGE_SAMPLE, TextStats, detect_language, fre_index,
+                  reading_difficulty)
+from syllables import count_text_syllables
+from tokenizer import (SENTENCE_END, count_sentences, count_vowels,
+                       count_words, last_sentence_end)
+
+
+BLOCK_SIZE = 1024
+PAGE_SIZE = 512
+SENTENCE_BREAK = re.compile(r'[.!?]+\s+')
+SPACE_RUN = re.compile(r'\s+')
+
+
+class Block:
+    """
+    Блок документа вместе с его статистикой: строка или часть длинной
+    строки, заканчивающаяся пробельными символами (см. split_blocks).
+
+    Attributes:
+        text (str): Текст блока, включая завершающий перевод строки.
+        words (int): Количество слов.
+        vowels (int): Количество гласных.
+        syllables (int): Количество слогов.
+        sentences (int): Количество фрагментов предложений в блоке.
+        blank (bool): Строка состоит только из пробельных символов.
+        head_open (bool): Первый фрагмент блока может продолжать
+            предложение из предыдущих блоков.
+        tail_open (bool): Последний фрагмент блока не завершен знаком
+            конца предложения.
+    """
+
+    __slots__ = ('text', 'words', 'vowels', 'syllables', 'sentences',
+                 'blank', 'head_open', 'tail_open')
+
+    def __init__(self, text):
+        self.text = text
+        self.words = count_words(text)
+        self.vowels = count_vowels(text)
+        self.syllables = count_text_syllables(text)
+        self.sentences = count_sentences(text)
+        self.blank = not text.strip()
+
+        match = SENTENCE_END.search(text)
+        head = text[:match.start()] if match else text
+        self.head_open = bool(head.strip())
+
+        last = last_sentence_end(text)
+        tail = text[last + 1:] if last >= 0 else text
+        self.tail_open = bool(tail.strip())
+
+
+def split_lines(text):
+    """
+    Делит текст на строки только по символу '\\n', сохраняя его.
+
+    Args:
+        text (str): Текст для разбиения.
+
+    Returns:
+        list[str]: Строки текста.
+    """
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def block_end(line, size):
+    """
+    Выбирает место разреза длинной строки: после пробельных символов,
+    чтобы слова не разрезались, и по возможности после конца предложения.
+
+    Args:
+        line (str): Строка длиннее size.
+        size (int): Желаемая наибольшая длина блока.
+
+    Returns:
+        int | None: Длина первого блока или None, если в строке после
+            начала нет пробельных символов.
+    """
+    window = line[:size]
+    cut = 0
+    for match in SENTENCE_BREAK.finditer(window):
+        cut = match.end()
+    if not cut:
+        for match in SPACE_RUN.finditer(window, 1):
+            cut = match.end()
+    if cut:
+        return cut
+    match = SPACE_RUN.search(line, size)
+    return match.end() if match and match.end() < len(line) else None
+
+
+def split_blocks(text, size=BLOCK_SIZE):
+    """
+    Делит текст на блоки: строки, а строки длиннее size — на части,
+    заканчивающиеся пробельными символами.
+
+    Слово без пробелов длиннее size остается в одном блоке.
+
+    Args:
+        text (str): Текст для разбиения.
+        size (int): Наибольшая длина блока.
+
+    Returns:
+        list[str]: Блоки текста.
+    """
+    blocks = []
+    for line in split_lines(text):
+        while len(line) > size:
+            cut = block_end(line, size)
+            if cut is None:
+                break
+            blocks.append(line[:cut])
+            line = line[cut:]
+        blocks.append(line)
+    return blocks
+
+
+class LengthIndex:
+    """
+    Длины блоков, разбитые на страницы не длиннее 2 * PAGE_SIZE.
+
+    Поиск блока по смещению, изменение длины и замена диапазона блоков
+    выполняются за O(n / PAGE_SIZE + PAGE_SIZE): суммы страниц
+    складываются и ищутся встроенными accumulate и bisect, а вставка
+    и удаление блоков меняют только одну-две страницы.
+    """
+
+    def __init__(self, lengths):
+        lengths = list(lengths)
+        self.pages = [lengths[index:index + PAGE_SIZE]
+                      for index in range(0, len(lengths), PAGE_SIZE)]
+        self.sums = [sum(page) for page in self.pages]
+        self.total = sum(self.sums)
+
+    def locate(self, index):
+        """
+        Находит страницу блока.
+
+        Args:
+            index (int): Индекс блока, не больше числа блоков.
+
+        Returns:
+            tuple[int, int]: Номер страницы и индекс блока в ней;
+                для индекса, равного числу блоков, — позиция за концом
+                последней страницы.
+        """
+        counts = list(accumulate(map(len, self.pages)))
+        page = bisect_right(counts, index)
+        if page == len(self.pages):
+            page -= 1
+        before = counts[page - 1] if page else 0
+        return page, index - before
+
+    def add(self, index, delta):
+        """
+        Изменяет длину блока.
+
+        Args:
+            index (int): Индекс блока.
+            delta (int): Изменение длины.
+        """
+        page, position = self.locate(index)
+        self.pages[page][position] += delta
+        self.sums[page] += delta
+        self.total += delta
+
+    def prefix(self, count):
+        """
+        Возвращает суммарную длину первых count блоков.
+
+        Args:
+            count (int): Количество блоков.
+
+        Returns:
+            int: Смещение начала блока с индексом count.
+        """
+        if not self.pages:
+            return 0
+        page, position = self.locate(count)
+        return sum(self.sums[:page]) + sum(self.pages[page][:position])
+
+    def find(self, offset):
+        """
+        Находит наибольшее число блоков, суммарная длина которых
+        не превышает offset.
+
+        Args:
+            offset (int): Смещение в документе.
+
+        Returns:
+            int: Количество блоков.
+        """
+        sums = list(accumulate(self.sums))
+        page = bisect_right(sums, offset)
+        count = sum(map(len, self.pages[:page]))
+        if page == len(self.pages):
+            return count
+        remainder = offset - (sums[page - 1] if page else 0)
+        return count + bisect_right(list(accumulate(self.pages[page])),
+                                    remainder)
+
+    def splice(self, first, last, lengths):
+        """
+        Заменяет длины блоков [first, last) новыми.
+
+        Args:
+            first (int): Индекс первого заменяемого блока.
+            last (int): Индекс за последним заменяемым блоком.
+            lengths (list[int]): Длины новых блоков.
+        """
+        if not self.pages:
+            self.__init__(lengths)
+            return
+
+        remove = last - first
+        page, position = self.locate(first)
+        while remove:
+            current = self.pages[page]
+            taken = current[position:position + remove]
+            del current[position:position + remove]
+            removed = sum(taken)
+            self.sums[page] -= removed
+            self.total -= removed
+            remove -= len(taken)
+            if remove:
+                page, position = page + 1, 0
+
+        page, position = self.locate(first)
+        current = self.pages[page]
+        current[position:position] = lengths
+        added = sum(lengths)
+        self.sums[page] += added
+        self.total += added
+
+        if len(current) > 2 * PAGE_SIZE:
+            parts = [current[index:index + PAGE_SIZE]
+                     for index in range(0, len(current), PAGE_SIZE)]
+            self.pages[page:page + 1] = parts
+            self.sums[page:page + 1] = [sum(part) for part in parts]
+        empty = [index for index, part in enumerate(self.pages) if not part]
+        for index in reversed(empty):
+            del self.pages[index]
+            del self.sums[index]
+
+
+def count_merges(blocks):
+    """
+    Считает предложения, продолжающиеся из одного блока в следующий
+    непустой блок.
+
+    Args:
+        blocks (list[Block]): Блоки документа.
+
+    Returns:
+        int: Количество переходов предложений через границы блоков.
+    """
+    merges = 0
+    previous = None
+    for block in blocks:
+        if block.blank:
+            continue
+        if previous is not None and previous.tail_open and block.head_open:
+            merges += 1
+        previous = block
+    return merges
+
+
+class IncrementalReadability(TextStats):
+    """
+    Статистика редактируемого документа, которая обновляется только
+    для измененных блоков.
+
+    Документ хранится как список блоков не длиннее BLOCK_SIZE (строк
+    и частей длинных строк, разрезанных по концам предложений) со своей
+    статистикой и постраничным индексом их длин. При правке
+    пересчитываются лишь затронутые блоки и переходы предложений через
+    их границы, а индекс длин заменяет только их длины, поэтому ни
+    правка, ни fre() и difficulty() не сканируют весь документ.
+    Результаты совпадают с fre_index и reading_difficulty для всего
+    текста.
+
+    Attributes:
+        words (int): Количество слов.
+        vowels (int): Количество гласных.
+        syllables (int): Количество слогов.
+        sentences (int): Количество предложений.
+        language (str): Язык текста (см. detect_language).
+    """
+
+    def __init__(self, text=''):
+        self.blocks = [Block(line) for line in split_blocks(text)]
+        self.words = sum(block.words for block in self.blocks)
+        self.vowels = sum(block.vowels for block in self.blocks)
+        self.syllables = sum(block.syllables for block in self.blocks)
+        self.fragments = sum(block.sentences for block in self.blocks)
+        self.merges = count_merges(self.blocks)
+        self.lengths = LengthIndex([len(block.text) for block in self.blocks])
+        self.update_language()
+
+    @property
+    def sentences(self):
+        return self.fragments - self.merges
+
+    @property
+    def text(self):
+        return ''.join(block.text for block in self.blocks)
+
+    def __len__(self):
+        return self.lengths.total
+
+    def update_language(self):
+        """Определяет язык по первым LANGUAGE_SAMPLE символам документа."""
+        sample = []
+        size = 0
+        for block in self.blocks:
+            if size >= LANGUAGE_SAMPLE:
+                break
+            sample.append(block.text)
+            size += len(block.text)
+        self.language = detect_language(''.join(sample)[:LANGUAGE_SAMPLE]) \
+            if self.words else 'ENG'
+
+    def neighbours(self, first, last):
+        """
+        Расширяет диапазон блоков до ближайших непустых блоков по краям.
+
+        Args:
+            first (int): Индекс первого блока диапазона.
+            last (int): Индекс за последним блоком диапазона.
+
+        Returns:
+            tuple[int, int]: Расширенный диапазон.
+        """
+        while first > 0:
+            first -= 1
+            if not self.blocks[first].blank:
+                break
+        while last < len(self.blocks):
+            last += 1
+            if not self.blocks[last - 1].blank:
+                break
+        return first, last
+
+    def replace(self, start, end, text):
+        """
+        Заменяет фрагмент документа [start, end) новым текстом.
+
+        Args:
+            start (int): Начало заменяемого фрагмента.
+            end (int): Конец заменяемого фрагмента.
+            text (str): Новый текст.
+        """
+        size = len(self)
+        if not 0 <= start <= end <= size:
+            raise IndexError(f"{start}:{end}")
+
+        if not self.blocks:
+            self.__init__(text)
+            return
+
+        blocks = self.blocks
+        first = min(self.lengths.find(start), len(blocks) - 1)
+        last = max(first, self.lengths.find(end - 1))
+
+        prefix = blocks[first].text[:start - self.lengths.prefix(first)]
+        suffix = blocks[last].text[end - self.lengths.prefix(last):]
+        merged = prefix + text + suffix
+        last += 1
+        while merged and not merged[-1].isspace() and last < len(blocks):
+            merged += blocks[last].text
+            last += 1
+
+        new_blocks = [Block(line) for line in split_blocks(merged)]
+
+        low, high = self.neighbours(first, last)
+        self.merges -= count_merges(blocks[low:high])
+        old_blocks = blocks[first:last]
+        for block in old_blocks:
+            self.words -= block.words
+            self.vowels -= block.vowels
+            self.syllables -= block.syllables
+            self.fragments -= block.sentences
+
+        blocks[first:last] = new_blocks
+        high += len(new_blocks) - (last - first)
+
+        for block in new_blocks:
+            self.words += block.words
+            self.vowels += block.vowels
+            self.syllables += block.syllables
+            self.fragments += block.sentences
+        self.merges += count_merges(blocks[low:high])
+
+        self.lengths.splice(first, last,
+                            [len(block.text) for block in new_blocks])
+        if start < LANGUAGE_SAMPLE or not self.words:
+            self.update_language()
+
+    def insert(self, offset, text):
+        """
+        Вставляет текст в документ.
+
+        Args:
+            offset (int): Позиция вставки.
+            text (str): Вставляемый текст.
+        """
+        self.replace(offset, offset, text)
+
+    def delete(self, offset, length):
+        """
+        Удаляет фрагмент документа.
+
+        Args:
+            offset (int): Начало удаляемого фрагмента.
+            length (int): Длина удаляемого фрагмента.
+        """
+        self.replace(offset, offset + length, '')
+
+    def fre(self):
+        """
+        Возвращает индекс читаемости документа по формуле Флеша.
+
+        Returns:
+            float: Индекс читаемости.
+        """
+        return fre_index(self)
+
+    def difficulty(self):
+        """
+        Возвращает сложность чтения документа.
+
+        Returns:
+            str: Сложность чтения.
+        """
+        return reading_difficulty(self)
@@ -0,0 +1,158 @@
+import functools
+import threading
+import time
+import ru_local as ru
+
+
+STAGES = (
+    'translate_text',
+    'send_translation',
+    'textblob_polarity',
+    'analyze_sentiment',
+    'count_words',
+    'count_vowels',
+    'count_sentences',
+    'count_text_syllables',
+    'detect_language',
+    'fre_index',
+    'reading_difficulty',
+)
+METRIC_PREFIX = 'text_analysis'
+
+stats = {}
+stats_lock = threading.Lock()
+originals = {}
+
+
+def record(name, seconds, size):
+    """
+    Учитывает один вызов этапа.
+
+    Args:
+        name (str): Имя этапа.
+        seconds (float): Время выполнения.
+        size (int): Объем обработанного текста в байтах.
+    """
+    with stats_lock:
+        entry = stats.setdefault(name, [0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += size
+
+
+def instrument(name, function):
+    """
+    Оборачивает функцию замером времени, числа вызовов и объема
+    обработанного текста.
+
+    Args:
+        name (str): Имя этапа.
+        function (Callable): Исходная функция.
+
+    Returns:
+        Callable: Обернутая функция.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            text = args[0] if args else None
+            size = len(text.encode('utf-8')) if isinstance(text, str) else 0
+            record(name, elapsed, size)
+
+    wrapper.instrumented = True
+    return wrapper
+
+
+def enable(namespace=None, stages=STAGES):
+    """
+    Включает замеры, подменяя функции этапов обернутыми версиями.
+
+    Пока замеры выключены, функции вызываются напрямую и накладных
+    расходов нет.
+
+    Args:
+        namespace (dict | None): Глобальные имена модуля с функциями
+            этапов; None означает модуль main.
+        stages (Iterable[str]): Имена функций для замера.
+    """
+    if namespace is None:
+        import main
+        namespace = vars(main)
+
+    for name in stages:
+        function = namespace.get(name)
+        if function is None or getattr(function, 'instrumented', False):
+            continue
+        originals[name] = (namespace, function)
+        namespace[name] = instrument(name, function)
+
+
+def disable():
+    """Выключает замеры и восстанавливает исходные функции."""
+    for name, (namespace, function) in originals.items():
+        namespace[name] = function
+    originals.clear()
+
+
+def reset():
+    """Сбрасывает накопленные замеры."""
+    with stats_lock:
+        stats.clear()
+
+
+def snapshot():
+    """
+    Возвращает накопленные замеры.
+
+    Returns:
+        dict: Для каждого этапа число вызовов (calls), суммарное время
+            в секундах (seconds) и объем текста в байтах (bytes).
+    """
+    with stats_lock:
+        return {name: {"calls": calls, "seconds": seconds, "bytes": size}
+                for name, (calls, seconds, size) in stats.items()}
+
+
+def prometheus():
+    """
+    Возвращает замеры в текстовом формате Prometheus.
+
+    Returns:
+        str: Метрики calls_total, seconds_total и bytes_total с меткой
+            stage.
+    """
+    data = snapshot()
+    lines = []
+    for metric, key, help_text in (
+            ('calls_total', 'calls', ru.PROFILE_HELP_CALLS),
+            ('seconds_total', 'seconds', ru.PROFILE_HELP_SECONDS),
+            ('bytes_total', 'bytes', ru.PROFILE_HELP_BYTES)):
+        full_name = f"{METRIC_PREFIX}_{metric}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} counter")
+        for name, entry in sorted(data.items()):
+            lines.append(f'{full_name}{{stage="{name}"}} {entry[key]}')
+    return '\n'.join(lines) + '\n'
+
+
+def summary():
+    """
+    Возвращает таблицу замеров, отсортированную по суммарному времени.
+
+    Returns:
+        str: Таблица для вывода в консоль.
+    """
+    rows = sorted(snapshot().items(), key=lambda item: -item[1]["seconds"])
+    lines = [f"{ru.PROFILE_STAGE:<22}{ru.PROFILE_CALLS:>10}"
+             f"{ru.PROFILE_TOTAL_MS:>14}{ru.PROFILE_MEAN_US:>14}"
+             f"{ru.PROFILE_BYTES:>14}"]
+    for name, entry in rows:
+        mean = entry["seconds"] / entry["calls"] * 1e6 if entry["calls"] else 0
+        lines.append(f"{name:<22}{entry['calls']:>10}"
+                     f"{entry['seconds'] * 1e3:>14.3f}{mean:>14.1f}"
+                     f"{entry['bytes']:>14}")
+    return '\n'.join(lines)
@@ -0,0 +1,159 @@
+from functools import lru_cache
+import re
+
+
+WORD_PATTERN = re.compile(r'[а-яё]+')
+MIN_STEM = 3
+
+NEGATIONS = {'не', 'нет', 'ни', 'без'}
+
+INTENSIFIERS = {
+    'очень': 1.3,
+    'крайне': 1.5,
+    'совсем': 1.3,
+    'слишком': 1.3,
+    'весьма': 1.2,
+    'абсолютно': 1.5,
+    'невероятно': 1.5,
+    'чуть': 0.7,
+    'немного': 0.7,
+    'довольно': 0.9,
+}
+
+# Основа слова: (полярность, субъективность).
+LEXICON = {
+    'хорош': (0.7, 0.6),
+    'отличн': (0.8, 0.75),
+    'прекрасн': (0.85, 1.0),
+    'замечательн': (0.8, 0.9),
+    'великолепн': (0.9, 1.0),
+    'восхитительн': (0.9, 1.0),
+    'превосходн': (0.9, 0.9),
+    'чудесн': (0.8, 0.9),
+    'удивительн': (0.6, 0.9),
+    'потрясающ': (0.9, 1.0),
+    'классн': (0.7, 0.8),
+    'крут': (0.6, 0.8),
+    'супер': (0.8, 0.8),
+    'любл': (0.6, 0.7),
+    'любим': (0.6, 0.7),
+    'любов': (0.5, 0.6),
+    'нрав': (0.6, 0.7),
+    'радост': (0.7, 0.8),
+    'раду': (0.6, 0.7),
+    'счаст': (0.8, 1.0),
+    'довол': (0.6, 0.7),
+    'приятн': (0.6, 0.7),
+    'интересн': (0.5, 0.6),
+    'полезн': (0.5, 0.4),
+    'удобн': (0.5, 0.5),
+    'красив': (0.7, 0.9),
+    'вкусн': (0.7, 0.8),
+    'успешн': (0.5, 0.4),
+    'лучш': (0.8, 0.6),
+    'благодар': (0.6, 0.6),
+    'спасиб': (0.5, 0.5),
+    'рекоменд': (0.5, 0.5),
+    'идеальн': (0.9, 0.9),
+    'надежн': (0.5, 0.5),
+    'быстр': (0.3, 0.4),
+    'весел': (0.6, 0.8),
+    'плох': (-0.7, 0.67),
+    'ужасн': (-1.0, 1.0),
+    'кошмар': (-0.9, 1.0),
+    'отвратительн': (-1.0, 1.0),
+    'мерзк': (-0.9, 1.0),
+    'худш': (-1.0, 1.0),
+    'хуж': (-0.7, 0.7),
+    'скучн': (-0.5, 0.8),
+    'груст': (-0.5, 0.8),
+    'печальн': (-0.5, 0.8),
+    'злой': (-0.6, 0.8),
+    'злая': (-0.6, 0.8),
+    'злит': (-0.6, 0.8),
+    'ненавид': (-0.9, 0.9),
+    'ненавист': (-0.9, 0.9),
+    'разочаров': (-0.7, 0.8),
+    'обман': (-0.8, 0.7),
+    'проблем': (-0.4, 0.4),
+    'ошибк': (-0.4, 0.3),
+    'слом': (-0.6, 0.4),
+    'неудобн': (-0.5, 0.5),
+    'медлен': (-0.3, 0.4),
+    'бесполезн': (-0.7, 0.6),
+    'жаль': (-0.4, 0.7),
+    'жалк': (-0.7, 0.9),
+    'страшн': (-0.6, 0.9),
+    'глуп': (-0.7, 0.9),
+    'неприятн': (-0.6, 0.7),
+    'отстой': (-0.9, 0.9),
+    'провал': (-0.7, 0.6),
+}
+
+MAX_STEM = max(len(stem) for stem in LEXICON)
+
+
+@lru_cache(maxsize=65536)
+def lookup(word):
+    """
+    Находит самую длинную основу слова в словаре тональности.
+
+    Args:
+        word (str): Слово в нижнем регистре.
+
+    Returns:
+        tuple[float, float] | None: Полярность и субъективность
+            или None, если слово нейтрально.
+    """
+    word = word.replace('ё', 'е')
+    for size in range(min(len(word), MAX_STEM), MIN_STEM - 1, -1):
+        entry = LEXICON.get(word[:size])
+        if entry is not None:
+            return entry
+    return None
+
+
+def score_russian(text):
+    """
+    Оценивает тональность русского текста по словарю основ
+    без перевода и обращения к сети.
+
+    Отрицание перед оценочным словом меняет знак его полярности
+    и ослабляет ее вдвое, усилители умножают полярность.
+
+    Args:
+        text (str): Текст для анализа.
+
+    Returns:
+        tuple[float, float]: Полярность (от -1 до 1) и субъективность
+            (от 0 до 1).
+    """
+    polarities = []
+    subjectivities = []
+    negate = False
+    intensity = 1.0
+
+    for word in WORD_PATTERN.findall(text.lower()):
+        if word in NEGATIONS:
+            negate = True
+            continue
+        if word in INTENSIFIERS:
+            intensity *= INTENSIFIERS[word]
+            continue
+
+        entry = lookup(word)
+        if entry is not None:
+            polarity, subjectivity = entry
+            polarity *= intensity
+            if negate:
+                polarity *= -0.5
+            polarities.append(max(-1.0, min(1.0, polarity)))
+            subjectivities.append(min(1.0, subjectivity * intensity))
+
+        negate = False
+        intensity = 1.0
+
+    if not polarities:
+        return 0.0, 0.0
+    return (sum(polarities) / len(polarities),
+            sum(subjectivities) / len(subjectivities))
@@ -1,13 +1,197 @@
-from deep_translator import GoogleTranslator
-from textblob import TextBlob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from analyzer import get_analyzer
+from cache import result_key
+from lexicon import score_russian
+from syllables import count_text_syllables
+from tokenizer import (WORD, WORD_SPAN, count_sentences, count_vowels,
+                       count_words, split_sentences)
 import re
+import sys
+import threading
 import ru_local as ru
 
 
+ANALYZER_VERSION = '1'
+
+translation_cache = None
+translation_scheduler = None
+result_store = None
+near_duplicates = None
+routing_stats = {"translated": 0, "skipped": 0}
+routing_lock = threading.Lock()
+
+HTTP_POOL_SIZE = 100
+http_session = None
+session_lock = threading.Lock()
+translators = threading.local()
+translators_generation = 0
+
+# deep_translator и textblob вместе с requests и NLTK импортируются
+# сотни миллисекунд, поэтому загружаются при первом переводе или оценке
+# тональности (см. также analyzer.get_analyzer), а подсчет метрик их
+# не импортирует. По той же причине asyncio импортируется в асинхронных
+# функциях.
+translator_factory = None
+
+
+def load_translator():
+    """
+    Импортирует переводчик при первом обращении.
+
+    Returns:
+        Callable[..., GoogleTranslator]: Фабрика переводчиков, которые
+            отправляют запросы через общую HTTP-сессию (см.
+            translator.session_factory), если она не была подменена.
+    """
+    global translator_factory
+    if translator_factory is None:
+        from translator import session_factory
+        translator_factory = session_factory(get_http_session())
+    return translator_factory
+
+
+def set_translation_cache(cache):
+    """
+    Подключает кэш переводов, который проверяется перед обращением
+    к переводчику.
+
+    Args:
+        cache: Объект с методами get(text, source, target) и
+            set(text, source, target, translation), например
+            cache.TranslationCache, или None, чтобы отключить кэш.
+    """
+    global translation_cache
+    translation_cache = cache
+
+
+def set_result_store(store):
+    """
+    Подключает хранилище результатов, которое проверяется в analyze_text
+    перед анализом.
+
+    Args:
+        store: Объект с методами get(key) и set(key, result), например
+            cache.ResultStore, или None, чтобы отключить хранилище.
+    """
+    global result_store
+    result_store = store
+
+
+def set_near_duplicate_index(index):
+    """
+    Подключает индекс почти одинаковых текстов: перевод и оценка
+    тональности текста, похожего на уже обработанный, берутся у него.
+    Оценки тональности переиспользуются только для зарегистрированных
+    способов оценки (см. register_sentiment_backend).
+
+    Args:
+        index: Объект с методами signature(text), get, add и group,
+            например neardup.NearDuplicateIndex, или None, чтобы
+            отключить индекс.
+    """
+    global near_duplicates
+    near_duplicates = index
+
+
+def set_translation_scheduler(scheduler):
+    """
+    Подключает планировщик, через который проходят все запросы
+    к переводчику.
+
+    Args:
+        scheduler: Объект с методом call(function, *args), например
+            scheduler.TranslationScheduler, или None, чтобы отправлять
+            запросы напрямую.
+    """
+    global translation_scheduler
+    translation_scheduler = scheduler
+
+
+def send_translation(text, target_language='en'):
+    """
+    Отправляет один запрос к переводчику, при необходимости через
+    планировщик.
+
+    Args:
+        text (str): Текст короче MAX_TRANSLATION_CHARS символов.
+        target_language (str): Язык, на который нужно перевести текст.
+
+    Returns:
+        str: Переведенный текст.
+    """
+    scheduler = translation_scheduler
+    if scheduler is None:
+        return get_translator(target_language).translate(text)
+    return scheduler.call(
+        lambda: get_translator(target_language).translate(text))
+
+
+def get_http_session():
+    """
+    Возвращает общую HTTP-сессию переводчика с пулом соединений.
+
+    Сессию использует только translator.SessionTranslator; модули
+    deep_translator не изменяются.
+
+    Returns:
+        requests.Session: Общая сессия.
+    """
+    global http_session
+    with session_lock:
+        if http_session is None:
+            from requests.adapters import HTTPAdapter
+            import requests
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4,
+                                  pool_maxsize=HTTP_POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            http_session = session
+    return http_session
+
+
+def get_translator(target_language='en'):
+    """
+    Возвращает переводчик для указанного языка, повторно используя
+    уже созданный.
+
+    GoogleTranslator хранит параметры запроса в самом объекте, поэтому
+    у каждого потока свои экземпляры, а HTTP-сессия общая.
+
+    Args:
+        target_language (str): Язык, на который нужно переводить.
+
+    Returns:
+        GoogleTranslator: Переводчик.
+    """
+    if getattr(translators, 'generation', None) != translators_generation:
+        translators.by_target = {}
+        translators.generation = translators_generation
+
+    translator = translators.by_target.get(target_language)
+    if translator is None:
+        translator = load_translator()(source='auto',
+                                       target=target_language)
+        translators.by_target[target_language] = translator
+    return translator
+
+
+def reset_translators():
+    """Сбрасывает созданные переводчики во всех потоках."""
+    global translators_generation
+    translators_generation += 1
+
+
 def translate_text(text, target_language='en'):
     """
     Переводит текст на указанный язык.
 
+    Перевод, взятый у почти одинакового текста (см.
+    set_near_duplicate_index), в кэш переводов не записывается: кэш
+    хранит только переводы самого текста.
+
     Args:
         text (str): Текст для перевода.
         target_language (str): Язык, на который нужно перевести текст.
@@ -15,32 +199,246 @@ def translate_text(text, target_language='en'):
     Returns:
         str: Переведенный текст.
     """
-    translator = GoogleTranslator(source='auto', target=target_language)
-    return translator.translate(text)
+    cache = translation_cache
+    if cache is not None:
+        cached = cache.get(text, 'auto', target_language)
+        if cached is not None:
+            return cached
+
+    index = near_duplicates
+    if index is not None:
+        kind = f"translation:{target_language}"
+        signature = index.signature(text)
+        borrowed = index.get(text, kind, signature)
+        if borrowed is not None:
+            return borrowed
+
+    translation = translate_uncached(text, target_language)
+
+    if index is not None and translation is not None:
+        index.add(text, kind, translation, signature)
+    if cache is not None and translation is not None:
+        cache.set(text, 'auto', target_language, translation)
+    return translation
 
 
-def analyze_sentiment(text):
+MAX_TRANSLATION_CHARS = 5000
+BATCH_SEPARATOR = '\n'
+TRANSLATION_WORKERS = 8
+
+
+def translate_uncached(text, target_language='en'):
     """
-    Анализирует тональность текста.
+    Переводит текст без обращения к кэшу; длинный текст переводится
+    частями.
 
     Args:
-        text (str): Текст для анализа.
+        text (str): Текст для перевода.
+        target_language (str): Язык, на который нужно перевести текст.
 
     Returns:
-        dict: Словарь с результатами анализа, включающий:
-            - polarity (float): Полярность текста (от -1 до 1).
-            - subjectivity (float): Субъективность текста (от 0 до 1).
-            - sentiment (str): Общая тональность текста
-              (позитивная, негативная или нейтральная).
-            - objectivity_percent (float): Объективность текста в процентах.
-            - subjectivity_percent (float): Субъективность текста в процентах.
+        str: Переведенный текст.
+    """
+    if len(text) >= MAX_TRANSLATION_CHARS:
+        return translate_long(text, target_language)
+    return send_translation(text, target_language)
+
+
+def chunk_text(text, max_chars=MAX_TRANSLATION_CHARS):
+    """
+    Делит текст на части короче max_chars символов по границам
+    предложений.
+
+    Предложение, которое само не помещается в лимит, делится по
+    пробелам, а слово длиннее лимита режется на куски. Склейка частей
+    дает исходный текст.
+
+    Args:
+        text (str): Текст для разбиения.
+        max_chars (int): Лимит символов на один запрос.
+
+    Returns:
+        list[str]: Части текста в исходном порядке.
+    """
+    limit = max_chars - 1
+    pieces = []
+    for sentence in split_sentences(text):
+        if len(sentence) <= limit:
+            pieces.append(sentence)
+            continue
+        for word in WORD_SPAN.findall(sentence):
+            pieces.extend(word[start:start + limit]
+                          for start in range(0, len(word), limit))
+
+    chunks = []
+    chunk = ''
+    for piece in pieces:
+        if chunk and len(chunk) + len(piece) > limit:
+            chunks.append(chunk)
+            chunk = ''
+        chunk += piece
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def translate_long(text, target_language='en',
+                   max_chars=MAX_TRANSLATION_CHARS):
+    """
+    Переводит длинный текст, параллельно отправляя его части и собирая
+    переводы в исходном порядке.
+
+    Args:
+        text (str): Текст для перевода.
+        target_language (str): Язык, на который нужно перевести текст.
+        max_chars (int): Лимит символов на один запрос.
+
+    Returns:
+        str: Переведенный текст.
+    """
+    chunks = [chunk for chunk in chunk_text(text, max_chars) if chunk.strip()]
+    if not chunks:
+        return text
+
+    workers = min(len(chunks), TRANSLATION_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return ' '.join(executor.map(send_translation, chunks,
+                                     [target_language] * len(chunks)))
+
+
+def pack_chunks(texts, max_chars=MAX_TRANSLATION_CHARS):
+    """
+    Упаковывает тексты в пакеты, укладывающиеся в лимит символов
+    одного запроса к переводчику.
+
+    Тексты, содержащие разделитель или не помещающиеся в лимит,
+    попадают в отдельный пакет.
+
+    Args:
+        texts (list[tuple[int, str]]): Пары (индекс, текст).
+        max_chars (int): Лимит символов на один запрос.
+
+    Returns:
+        list[list[tuple[int, str]]]: Пакеты пар (индекс, текст).
     """
-    english_text = translate_text(text, 'en')
-    analysis = TextBlob(english_text)
+    chunks = []
+    chunk = []
+    size = 0
+
+    for index, text in texts:
+        if BATCH_SEPARATOR in text or len(text) >= max_chars:
+            chunks.append([(index, text)])
+            continue
+
+        extra = len(text) + (len(BATCH_SEPARATOR) if chunk else 0)
+        if chunk and size + extra >= max_chars:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+            extra = len(text)
+
+        chunk.append((index, text))
+        size += extra
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def translate_chunk(chunk, target_language='en'):
+    """
+    Переводит пакет текстов одним запросом.
+
+    Если запрос завершился ошибкой или число строк в ответе не совпало
+    с числом текстов, каждый текст пакета переводится отдельно.
+
+    Args:
+        chunk (list[tuple[int, str]]): Пакет пар (индекс, текст).
+        target_language (str): Язык, на который нужно перевести тексты.
+
+    Returns:
+        list[str]: Переводы в порядке текстов пакета.
+    """
+    if len(chunk) > 1:
+        try:
+            joined = send_translation(
+                BATCH_SEPARATOR.join(text for _, text in chunk),
+                target_language)
+            parts = joined.split(BATCH_SEPARATOR) if joined else []
+            if len(parts) == len(chunk):
+                return [part.strip() for part in parts]
+        except Exception:
+            pass
+
+    return [translate_uncached(text, target_language) for _, text in chunk]
+
+
+def translate_many(texts, target_language='en',
+                   max_chars=MAX_TRANSLATION_CHARS):
+    """
+    Переводит список текстов, упаковывая их в минимальное число запросов.
+
+    Args:
+        texts (list[str]): Тексты для перевода.
+        target_language (str): Язык, на который нужно перевести тексты.
+        max_chars (int): Лимит символов на один запрос.
+
+    Returns:
+        list[str]: Переводы в том же порядке, что и тексты.
+    """
+    results = [None] * len(texts)
+    cache = translation_cache
+    pending = []
+
+    for index, text in enumerate(texts):
+        if not text or text.strip() == '':
+            results[index] = text
+            continue
+        if cache is not None:
+            cached = cache.get(text, 'auto', target_language)
+            if cached is not None:
+                results[index] = cached
+                continue
+        pending.append((index, text))
 
-    polarity = analysis.sentiment.polarity
-    subjectivity = analysis.sentiment.subjectivity
+    if not pending:
+        return results
 
+    for chunk in pack_chunks(pending, max_chars):
+        translations = translate_chunk(chunk, target_language)
+        for (index, text), translation in zip(chunk, translations):
+            results[index] = translation
+            if cache is not None and translation is not None:
+                cache.set(text, 'auto', target_language, translation)
+
+    return results
+
+
+def textblob_polarity(english_text):
+    """
+    Оценивает полярность и субъективность английского текста с помощью
+    словаря TextBlob (см. analyzer.SentimentAnalyzer).
+
+    Args:
+        english_text (str): Текст на английском языке.
+
+    Returns:
+        tuple[float, float]: Полярность и субъективность.
+    """
+    return get_analyzer().score(english_text)
+
+
+def sentiment_result(polarity, subjectivity):
+    """
+    Формирует словарь с результатами анализа тональности.
+
+    Args:
+        polarity (float): Полярность текста (от -1 до 1).
+        subjectivity (float): Субъективность текста (от 0 до 1).
+
+    Returns:
+        dict: Словарь с результатами анализа в формате analyze_sentiment.
+    """
     if polarity > 0.1:
         sentiment = ru.POSITIVE
     elif polarity < -0.1:
@@ -57,86 +455,618 @@ def analyze_sentiment(text):
     }
 
 
-def count_words(text):
+def score_sentiment(english_text):
     """
-    Подсчитывает количество слов в тексте.
+    Оценивает тональность текста на английском языке.
 
     Args:
-        text (str): Текст для подсчета.
+        english_text (str): Текст на английском языке.
 
     Returns:
-        int: Количество слов.
+        dict: Словарь с результатами анализа в формате analyze_sentiment.
     """
-    return len(text.split())
+    return sentiment_result(*textblob_polarity(english_text))
 
 
-def count_vowels(text):
+def needs_translation(text):
     """
-    Подсчитывает количество гласных в тексте.
+    Определяет, нужно ли переводить текст перед оценкой тональности.
+
+    Текст без букв и латинский текст, который latin_language
+    не относит явно к другому языку, передаются в TextBlob напрямую;
+    переводятся текст другой письменности и латинский текст,
+    распознанный как французский, немецкий и т. д. Решение учитывается
+    в счетчиках routing_stats.
 
     Args:
-        text (str): Текст для подсчета.
+        text (str): Текст для анализа.
 
     Returns:
-        int: Количество гласных.
+        bool: True, если текст нужно перевести на английский.
     """
-    vowels = 'aeiouyаоуыэиёеяю'
-    return sum(1 for letter in text.lower() if letter in vowels)
+    script, confidence = detect_script(text)
+    if not confidence:
+        translate = False
+    elif script == 'ENG':
+        translate = latin_language(text) != 'ENG'
+    else:
+        translate = True
+
+    with routing_lock:
+        if translate:
+            routing_stats["translated"] += 1
+        else:
+            routing_stats["skipped"] += 1
+    return translate
+
+
+def reset_routing_stats():
+    """Сбрасывает счетчики маршрутизации перевода."""
+    with routing_lock:
+        routing_stats["translated"] = 0
+        routing_stats["skipped"] = 0
 
 
-def count_sentences(text):
+def translating_backend(text):
     """
-    Подсчитывает количество предложений в тексте.
+    Оценивает тональность через перевод на английский и TextBlob.
 
     Args:
-        text (str): Текст для подсчета.
+        text (str): Текст для анализа.
 
     Returns:
-        int: Количество предложений.
+        tuple[float, float]: Полярность и субъективность.
+    """
+    english_text = text
+    if needs_translation(text):
+        english_text = translate_text(text, 'en')
+    return textblob_polarity(english_text)
+
+
+def offline_backend(text):
+    """
+    Оценивает тональность без перевода и обращения к сети: латинский
+    текст оценивается TextBlob, остальной — русским словарем тональности.
+
+    Args:
+        text (str): Текст для анализа.
+
+    Returns:
+        tuple[float, float]: Полярность и субъективность.
     """
     if not text or text.strip() == '':
-        return 0
+        return 0.0, 0.0
+    if detect_script(text)[0] == 'ENG':
+        return textblob_polarity(text)
+    return score_russian(text)
 
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    return len(sentences)
 
+sentiment_backend = translating_backend
 
-def detect_language(text):
+
+def set_sentiment_backend(backend):
+    """
+    Задает способ оценки тональности по умолчанию.
+
+    Args:
+        backend (Callable[[str], tuple[float, float]]): Функция, которая
+            возвращает полярность и субъективность текста, например
+            translating_backend или offline_backend.
+    """
+    global sentiment_backend
+    sentiment_backend = backend
+
+
+# Имена способов оценки тональности, по которым различаются результаты
+# в хранилище результатов и индексе почти одинаковых текстов.
+sentiment_backends = {
+    'translating': translating_backend,
+    'offline': offline_backend,
+}
+
+
+def register_sentiment_backend(name, backend):
+    """
+    Регистрирует способ оценки тональности под явным именем, чтобы его
+    результаты можно было сохранять и переиспользовать.
+
+    Args:
+        name (str): Имя способа, уникальное среди зарегистрированных.
+        backend (Callable[[str], tuple[float, float]]): Способ оценки.
+    """
+    sentiment_backends[name] = backend
+
+
+def backend_name(backend):
+    """
+    Возвращает зарегистрированное имя способа оценки тональности.
+
+    Args:
+        backend (Callable[[str], tuple[float, float]]): Способ оценки.
+
+    Returns:
+        str | None: Имя или None, если способ не зарегистрирован.
+    """
+    for name, registered in sentiment_backends.items():
+        if registered is backend:
+            return name
+    return None
+
+
+def analyze_sentiment(text, backend=None):
+    """
+    Анализирует тональность текста.
+
+    Args:
+        text (str): Текст для анализа.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        dict: Словарь с результатами анализа, включающий:
+            - polarity (float): Полярность текста (от -1 до 1).
+            - subjectivity (float): Субъективность текста (от 0 до 1).
+            - sentiment (str): Общая тональность текста
+              (позитивная, негативная или нейтральная).
+            - objectivity_percent (float): Объективность текста в процентах.
+            - subjectivity_percent (float): Субъективность текста в процентах.
+    """
+    return lookup_sentiment(text, backend)[0]
+
+
+def lookup_sentiment(text, backend=None):
+    """
+    Анализирует тональность текста и сообщает, взята ли оценка у почти
+    одинакового текста (см. set_near_duplicate_index).
+
+    Args:
+        text (str): Текст для анализа.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        tuple[dict, bool]: Результат в формате analyze_sentiment и
+            признак того, что он взят у другого текста.
+    """
+    backend = backend or sentiment_backend
+    index = near_duplicates
+    name = backend_name(backend) if index is not None else None
+    if name is None:
+        return sentiment_result(*backend(text)), False
+
+    kind = f"sentiment:{name}"
+    signature = index.signature(text)
+    result = index.get(text, kind, signature)
+    if result is not None:
+        return dict(result), True
+    result = sentiment_result(*backend(text))
+    index.add(text, kind, result, signature)
+    return dict(result), False
+
+
+def analyze_sentiment_many(texts, backend=None):
+    """
+    Анализирует тональность списка текстов.
+
+    При переводе через TextBlob все тексты, которым нужен перевод,
+    переводятся вместе через translate_many, то есть минимальным
+    числом запросов.
+    Если подключен индекс почти одинаковых текстов (см.
+    set_near_duplicate_index), оценивается по одному тексту из каждой
+    группы похожих, не встречавшейся раньше.
+
+    Args:
+        texts (list[str]): Тексты для анализа.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        list[dict]: Результаты анализа в том же порядке, что и тексты.
+    """
+    return lookup_sentiment_many(texts, backend)[0]
+
+
+def lookup_sentiment_many(texts, backend=None):
+    """
+    Анализирует тональность списка текстов так же, как
+    analyze_sentiment_many, и сообщает, какие оценки взяты у почти
+    одинаковых текстов.
+
+    Args:
+        texts (list[str]): Тексты для анализа.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        tuple[list[dict], list[bool]]: Результаты в том же порядке, что
+            и тексты, и признаки того, что результат взят у другого
+            текста.
+    """
+    backend = backend or sentiment_backend
+    index = near_duplicates
+    name = backend_name(backend) if index is not None else None
+    if name is None:
+        return score_sentiment_many(texts, backend), [False] * len(texts)
+
+    kind = f"sentiment:{name}"
+    signatures = [index.signature(text) for text in texts]
+    results = [index.get(text, kind, signature)
+               for text, signature in zip(texts, signatures)]
+    borrowed = [result is not None for result in results]
+    missing = [position for position, result in enumerate(results)
+               if result is None]
+    groups = index.group([texts[position] for position in missing], kind,
+                         [signatures[position] for position in missing])
+    unique = sorted(set(groups))
+    scored = dict(zip(unique, score_sentiment_many(
+        [texts[missing[local]] for local in unique], backend)))
+    for local, position in enumerate(missing):
+        results[position] = scored[groups[local]]
+        if groups[local] == local:
+            index.add(texts[position], kind, results[position],
+                      signatures[position])
+        else:
+            borrowed[position] = True
+    return [dict(result) for result in results], borrowed
+
+
+def score_sentiment_many(texts, backend):
+    """
+    Оценивает тональность списка текстов без обращения к индексу
+    почти одинаковых текстов.
+
+    Args:
+        texts (list[str]): Тексты для анализа.
+        backend (Callable[[str], tuple[float, float]]): Способ оценки
+            тональности.
+
+    Returns:
+        list[dict]: Результаты анализа в том же порядке, что и тексты.
+    """
+    if backend is not translating_backend:
+        return [sentiment_result(*backend(text)) for text in texts]
+
+    english_texts = list(texts)
+    indices = [index for index, text in enumerate(texts)
+               if needs_translation(text)]
+    translations = translate_many([texts[index] for index in indices], 'en')
+    for index, translation in zip(indices, translations):
+        english_texts[index] = translation
+    return [score_sentiment(text) for text in english_texts]
+
+
+def readability(text):
+    """
+    Вычисляет метрики читаемости текста.
+
+    Args:
+        text (str | TextStats): Текст или готовая статистика текста.
+
+    Returns:
+        dict: words, vowels, sentences, language, fre_index и difficulty.
+    """
+    stats = text_stats(text)
+    return {
+        "words": stats.words,
+        "vowels": stats.vowels,
+        "sentences": stats.sentences,
+        "language": stats.language,
+        "fre_index": fre_index(stats),
+        "difficulty": reading_difficulty(stats),
+    }
+
+
+async def analyze_sentiment_async(text, executor=None, backend=None):
+    """
+    Асинхронно анализирует тональность текста.
+
+    Сетевой перевод и оценка тональности выполняются в пуле потоков,
+    поэтому цикл событий не блокируется. Индекс почти одинаковых
+    текстов (см. set_near_duplicate_index) используется так же, как
+    в analyze_sentiment.
+
+    Args:
+        text (str): Текст для анализа.
+        executor (Executor | None): Пул для выполнения блокирующих
+            вызовов; None означает пул цикла событий по умолчанию.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        dict: Словарь с результатами анализа в формате analyze_sentiment.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    backend = backend or sentiment_backend
+    if backend is not translating_backend:
+        return await loop.run_in_executor(
+            executor, analyze_sentiment, text, backend)
+
+    index = near_duplicates
+    name = backend_name(backend) if index is not None else None
+    if name is not None:
+        kind = f"sentiment:{name}"
+        signature = index.signature(text)
+        result = index.get(text, kind, signature)
+        if result is not None:
+            return dict(result)
+
+    english_text = text
+    if needs_translation(text):
+        english_text = await loop.run_in_executor(
+            executor, translate_text, text, 'en')
+    result = await loop.run_in_executor(executor, score_sentiment,
+                                        english_text)
+    if name is not None:
+        index.add(text, kind, result, signature)
+    return dict(result)
+
+
+async def iterate_async(texts):
+    """
+    Обходит обычный или асинхронный итерируемый объект.
+
+    Args:
+        texts (Iterable | AsyncIterable): Источник текстов.
+
+    Yields:
+        str: Очередной текст.
+    """
+    if hasattr(texts, '__aiter__'):
+        async for text in texts:
+            yield text
+    else:
+        for text in texts:
+            yield text
+
+
+async def analyze_stream_async(texts, concurrency=100, backend=None):
+    """
+    Анализирует тональность потока текстов, держа одновременно
+    в работе не более concurrency текстов.
+
+    Args:
+        texts (Iterable[str] | AsyncIterable[str]): Поток текстов.
+        concurrency (int): Максимальное число одновременных анализов.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Yields:
+        dict: Результаты анализа в порядке поступления текстов.
+    """
+    import asyncio
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = deque()
+
+    async def run(text):
+        async with semaphore:
+            return await analyze_sentiment_async(text, executor, backend)
+
+    try:
+        async for text in iterate_async(texts):
+            pending.append(asyncio.ensure_future(run(text)))
+            if len(pending) >= 2 * concurrency:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        executor.shutdown(wait=False)
+
+
+LANGUAGE_SAMPLE = 4096
+LANGUAGE_WINDOWS = (256, 1024, LANGUAGE_SAMPLE)
+LANGUAGE_MIN_LETTERS = 32
+LANGUAGE_CONFIDENCE = 0.95
+SCRIPTS = {
+    'RU': re.compile(r'[\u0400-\u04FF]'),
+    'ENG': re.compile(r'[A-Za-z\u00C0-\u024F]'),
+    'GR': re.compile(r'[\u0370-\u03FF]'),
+    'HE': re.compile(r'[\u0590-\u05FF]'),
+    'AR': re.compile(r'[\u0600-\u06FF]'),
+    'HI': re.compile(r'[\u0900-\u097F]'),
+    'JA': re.compile(r'[\u3040-\u30FF]'),
+    'ZH': re.compile(r'[\u4E00-\u9FFF]'),
+    'KO': re.compile(r'[\uAC00-\uD7AF]'),
+}
+# Латиницей (ENG в SCRIPTS) пишут многие языки; они различаются
+# по частым служебным словам.
+LATIN_STOPWORDS = {
+    'ENG': frozenset((
+        'the', 'and', 'of', 'to', 'is', 'that', 'it', 'for', 'with', 'was',
+        'on', 'are', 'this', 'be', 'not', 'you', 'have', 'but', 'they',
+        'at', 'by', 'from', 'we', 'he', 'she', 'his', 'her', 'or', 'an',
+        'will', 'my', 'would', 'there', 'their', 'what', 'if', 'which',
+        'when', 'can', 'i', 'do', 'very', 'been', 'has', 'had', 'were',
+        'a', 'as', 'in', 'no', 'so', 'all', 'me', 'us', 'our', 'your',
+        'its', 'them', 'than', 'then', 'up', 'out', 'just', 'about',
+        'one', 'more', 'some', 'any', 'how', 'who', 'did', 'does', 'am',
+        'into', 'over', 'only', 'also', 'after')),
+    'FR': frozenset((
+        'le', 'la', 'les', 'et', 'est', 'un', 'une', 'des', 'du', 'que',
+        'qui', 'pas', 'pour', 'dans', 'ce', 'il', 'elle', 'sur', 'avec',
+        'je', 'nous', 'vous', 'mais', 'sont', 'au', 'aux', 'cette', 'très',
+        'ne', "c'est")),
+    'ES': frozenset((
+        'el', 'los', 'las', 'y', 'es', 'un', 'una', 'que', 'del', 'por',
+        'para', 'con', 'se', 'al', 'lo', 'como', 'pero', 'muy', 'su',
+        'está', 'son', 'yo', 'ella', 'esto', 'la', 'de', 'en')),
+    'DE': frozenset((
+        'der', 'die', 'das', 'und', 'ist', 'ein', 'eine', 'nicht', 'mit',
+        'zu', 'den', 'von', 'sich', 'auch', 'auf', 'für', 'ich', 'sie',
+        'es', 'wir', 'sehr', 'aber', 'oder', 'dem', 'des', 'im')),
+    'IT': frozenset((
+        'il', 'lo', 'gli', 'le', 'è', 'una', 'che', 'di', 'non', 'per',
+        'con', 'del', 'della', 'sono', 'ma', 'molto', 'questo', 'anche',
+        'io', 'un', 'la', 'e')),
+    'PT': frozenset((
+        'o', 'os', 'as', 'é', 'um', 'uma', 'que', 'não', 'para', 'com',
+        'do', 'da', 'em', 'no', 'na', 'muito', 'mas', 'eu', 'ele', 'ela',
+        'são', 'e', 'de', 'a')),
+}
+# Латинский текст считается не английским, только если служебных слов
+# другого языка не меньше LATIN_MIN_HITS и в LATIN_MARGIN раз больше,
+# чем английских.
+LATIN_MIN_HITS = 2
+LATIN_MARGIN = 2
+LANGUAGES = tuple(SCRIPTS) + tuple(language for language in LATIN_STOPWORDS
+                                   if language not in SCRIPTS)
+
+
+def script_histogram(text):
+    """
+    Подсчитывает буквы каждой письменности в тексте.
+
+    Args:
+        text (str): Текст для анализа.
+
+    Returns:
+        dict: Количество букв по языкам письменностей из SCRIPTS.
+    """
+    return {language: len(pattern.findall(text))
+            for language, pattern in SCRIPTS.items()}
+
+
+def detect_script(text):
     """
-    Определяет язык текста (RU или ENG).
+    Определяет язык текста по письменности его начала.
+
+    Анализируется не более LANGUAGE_SAMPLE первых символов: сначала
+    короткий фрагмент, и только если решение неоднозначно — более
+    длинный, поэтому время не зависит от длины текста.
 
     Args:
         text (str): Текст для анализа.
 
     Returns:
-        str: Язык.
+        tuple[str, float]: Язык (RU, ENG, GR, HE, AR, HI, JA, ZH или KO)
+            и уверенность от 0 до 1. Для текста без букв — ('ENG', 0.0).
+    """
+    language, confidence = 'ENG', 0.0
+    for window in LANGUAGE_WINDOWS:
+        histogram = script_histogram(text[:window])
+        total = sum(histogram.values())
+        if total:
+            language = max(histogram, key=histogram.get)
+            confidence = histogram[language] / total
+            if total >= LANGUAGE_MIN_LETTERS \
+                    and confidence >= LANGUAGE_CONFIDENCE:
+                break
+        if window >= len(text):
+            break
+    if language == 'ZH' and histogram['JA']:
+        language = 'JA'
+    return language, confidence
+
+
+def latin_language(text):
     """
-    no_space = text.replace(' ', '')
-    total_u = sum(ord(letter) for letter in no_space)
-    
-    if total_u // len(no_space) > 500:
-        return 'RU'
+    Определяет язык латинского текста по служебным словам из
+    LATIN_STOPWORDS в первых LANGUAGE_SAMPLE символах.
+
+    По умолчанию текст считается английским; другой язык выбирается,
+    только если его служебных слов не меньше LATIN_MIN_HITS и
+    в LATIN_MARGIN раз больше, чем английских.
+
+    Args:
+        text (str): Текст для анализа.
+
+    Returns:
+        str: Язык (ENG, FR, ES, DE, IT или PT).
+    """
+    words = WORD.findall(text[:LANGUAGE_SAMPLE].lower())
+    votes = {language: sum(word in stopwords for word in words)
+             for language, stopwords in LATIN_STOPWORDS.items()}
+    english = votes.pop('ENG')
+    language = max(votes, key=votes.get)
+    if votes[language] >= max(LATIN_MIN_HITS, LATIN_MARGIN * english,
+                              english + 1):
+        return language
     return 'ENG'
 
 
+def detect_language(text):
+    """
+    Определяет язык текста по письменности (RU, ENG и другие,
+    см. detect_script), а для латиницы — по служебным словам
+    (см. latin_language). Латинский текст считается английским, если
+    служебные слова не указывают явно на другой язык.
+
+    Args:
+        text (str): Текст для анализа.
+
+    Returns:
+        str: Язык из LANGUAGES.
+    """
+    language = detect_script(text)[0]
+    if language == 'ENG':
+        return latin_language(text)
+    return language
+
+
+class TextStats:
+    """
+    Статистика текста, в которой каждая метрика вычисляется один раз.
+
+    Слова, гласные, слоги, предложения и язык подсчитываются отдельными
+    проходами по тексту при создании объекта, после чего fre_index и
+    reading_difficulty читают готовые значения вместо повторного
+    сканирования текста.
+
+    Attributes:
+        words (int): Количество слов.
+        vowels (int): Количество гласных.
+        syllables (int): Количество слогов.
+        sentences (int): Количество предложений.
+        language (str): Язык текста (см. detect_language).
+    """
+
+    def __init__(self, text):
+        self.words = count_words(text)
+        self.vowels = count_vowels(text)
+        self.syllables = count_text_syllables(text)
+        self.sentences = count_sentences(text)
+        self.language = detect_language(text) if self.words else 'ENG'
+
+
+def text_stats(text):
+    """
+    Возвращает статистику текста, не пересчитывая уже готовую.
+
+    Args:
+        text (str | TextStats): Текст или готовая статистика.
+
+    Returns:
+        TextStats: Статистика текста.
+    """
+    if isinstance(text, TextStats):
+        return text
+    return TextStats(text)
+
+
 def fre_index(text):
     """
     Вычисляет индекс читаемости текста по формуле Флеша.
 
     Args:
-        text (str): Текст для анализа.
+        text (str | TextStats): Текст или готовая статистика текста.
 
     Returns:
         float: Индекс читаемости.
     """
-    if count_words(text) == 0:
+    stats = text_stats(text)
+    if stats.words == 0:
         return 0
 
-    asl = count_words(text) / count_sentences(text)
-    asw = count_vowels(text) / count_words(text)
+    asl = stats.words / max(stats.sentences, 1)
+    asw = stats.syllables / stats.words
 
-    if detect_language(text) == 'RU':
+    if stats.language == 'RU':
         return 206.835 - 1.52 * asl - 65.14 * asw
     return 206.835 - 1.015 * asl - 84.6 * asw
 
@@ -146,35 +1076,133 @@ def reading_difficulty(text):
         Вычисляет сложноость чтения текста, исходя их формулы Флеша.
 
         Args:
-            text (str): Текст для анализа.
+            text (str | TextStats): Текст или готовая статистика текста.
 
         Returns:
             str: Сложность чтения.
     """
-    if fre_index(text) > 80:
+    index = fre_index(text)
+
+    if index > 80:
         return ru.SIMPLE
 
-    elif fre_index(text) > 50:
+    elif index > 50:
         return ru.MEDIUM
 
-    elif fre_index(text) > 25:
+    elif index > 25:
         return ru.HARD
 
-    elif fre_index(text) < 25:
+    elif index < 25:
         return ru.IMPOSSIBLE
 
 
+def analyze_text(text, sentiment=True, backend=None):
+    """
+    Выполняет полный анализ текста.
+
+    Если подключено хранилище результатов (см. set_result_store),
+    результат ищется по хэшу текста, версии анализатора ANALYZER_VERSION
+    и имени способа оценки тональности, поэтому неизменные документы
+    повторно не анализируются. Результаты незарегистрированных способов
+    оценки (см. register_sentiment_backend) и результаты с оценкой
+    тональности, взятой у почти одинакового текста (см.
+    set_near_duplicate_index), не сохраняются.
+
+    Args:
+        text (str): Текст для анализа.
+        sentiment (bool): Нужно ли оценивать тональность.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        dict: Результаты analyze_sentiment (если sentiment=True), а также
+            words, vowels, sentences, language, fre_index и difficulty.
+    """
+    store = result_store
+    key = None
+    if store is not None:
+        backend = backend or sentiment_backend
+        options = backend_name(backend) if sentiment else ''
+        if options is not None:
+            key = result_key(text, ANALYZER_VERSION, options)
+            result = store.get(key)
+            if result is not None:
+                return result
+
+    result, borrowed = lookup_sentiment(text, backend) if sentiment \
+        else ({}, False)
+    result.update(readability(text))
+    if key is not None and not borrowed:
+        store.set(key, result)
+    return result
+
+
+def analyze_texts(texts, sentiment=True, backend=None):
+    """
+    Выполняет полный анализ списка текстов.
+
+    Результат совпадает с analyze_text для каждого текста, но
+    тональность оценивается одним вызовом lookup_sentiment_many, то есть
+    переводы упаковываются в минимальное число запросов. Хранилище
+    результатов (см. set_result_store) используется так же, как в
+    analyze_text.
+
+    Args:
+        texts (list[str]): Тексты для анализа.
+        sentiment (bool): Нужно ли оценивать тональность.
+        backend (Callable[[str], tuple[float, float]] | None): Способ
+            оценки тональности; None означает sentiment_backend.
+
+    Returns:
+        list[dict]: Результаты анализа в том же порядке, что и тексты.
+    """
+    store = result_store
+    backend = backend or sentiment_backend
+    results = [None] * len(texts)
+    keys = [None] * len(texts)
+    if store is not None:
+        options = backend_name(backend) if sentiment else ''
+        if options is not None:
+            for position, text in enumerate(texts):
+                keys[position] = result_key(text, ANALYZER_VERSION, options)
+                results[position] = store.get(keys[position])
+
+    missing = [position for position, result in enumerate(results)
+               if result is None]
+    if sentiment:
+        sentiments, borrowed = lookup_sentiment_many(
+            [texts[position] for position in missing], backend)
+    else:
+        sentiments, borrowed = [{} for _ in missing], [False] * len(missing)
+    for position, result, reused in zip(missing, sentiments, borrowed):
+        result.update(readability(texts[position]))
+        results[position] = result
+        if keys[position] is not None and not reused:
+            store.set(keys[position], result)
+    return results
+
+
 if __name__ == "__main__":
+    profile = '--profile' in sys.argv[1:]
+    if profile:
+        import instrumentation
+        instrumentation.enable(globals())
+
     text = input(ru.TEXT)
 
     results = analyze_sentiment(text)
+    stats = TextStats(text)
 
     print(f"{ru.SENTIMENT} {results['sentiment']}")
     print(f"{ru.POLARITY} {results['polarity']}")
     print(f"{ru.OBJJECTIVITY}: {results['objectivity_percent']}%")
-    print(f"{ru.WORDS}: {count_words(text)}")
-    print(f"{ru.VOWELS}: {count_vowels(text)}")
-    print(f"{ru.SENTENCES} {count_sentences(text)}")
-    print(f"{ru.LANGUAGE}: {detect_language(text)}")
-    print(f"{ru.FRE_INDEX}: {fre_index(text)}")
-    print(reading_difficulty(text))
+    print(f"{ru.WORDS}: {stats.words}")
+    print(f"{ru.VOWELS}: {stats.vowels}")
+    print(f"{ru.SENTENCES} {stats.sentences}")
+    print(f"{ru.LANGUAGE}: {stats.language}")
+    print(f"{ru.FRE_INDEX}: {fre_index(stats)}")
+    print(reading_difficulty(stats))
+
+    if profile:
+        print()
+        print(instrumentation.summary())
@@ -0,0 +1,315 @@
+from collections import OrderedDict
+import hashlib
+import random
+import threading
+from tokenizer import WORD
+
+
+MERSENNE_PRIME = (1 << 61) - 1
+SIGNATURE_MEMO = 256
+
+
+def shingles(text, size=2):
+    """
+    Разбивает текст на шинглы — последовательности из size слов.
+
+    Числа в слова не входят (см. tokenizer.WORD), поэтому шаблонные
+    сообщения, различающиеся только числами, дают одинаковые шинглы.
+
+    Args:
+        text (str): Исходный текст.
+        size (int): Количество слов в шингле.
+
+    Returns:
+        set[str]: Шинглы текста; для текста короче size слов — один
+            шингл из всех слов.
+    """
+    words = WORD.findall(text.lower())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[index:index + size])
+            for index in range(len(words) - size + 1)}
+
+
+def shingle_hash(shingle):
+    """
+    Вычисляет 64-битный хэш шингла, одинаковый во всех процессах.
+
+    Args:
+        shingle (str): Шингл.
+
+    Returns:
+        int: Хэш шингла.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(),
+        'little')
+
+
+class NearDuplicateIndex:
+    """
+    Индекс почти одинаковых текстов на основе MinHash и LSH.
+
+    Для каждого текста строится MinHash-подпись по шинглам слов;
+    подпись делится на bands полос, и тексты с совпадающей полосой
+    становятся кандидатами. Кандидат считается почти дубликатом, если
+    оценка сходства Жаккара по подписям не ниже threshold. Сохраненные
+    для него значения (перевод, оценка тональности) переиспользуются.
+
+    Значения хранятся по видам (kind), например 'translation:en' или
+    'sentiment:translating', чтобы результаты разных операций
+    не смешивались. При превышении max_entries вытесняются самые
+    старые тексты.
+
+    Attributes:
+        hits (int): Количество переиспользованных значений.
+        misses (int): Количество запросов без подходящего дубликата.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=64, bands=16, shingle_size=2,
+                 max_entries=100000, seed=1):
+        """
+        Args:
+            threshold (float): Минимальное сходство для переиспользования.
+            num_perm (int): Длина MinHash-подписи.
+            bands (int): Количество полос LSH; num_perm должно делиться
+                на bands.
+            shingle_size (int): Количество слов в шингле.
+            max_entries (int | None): Максимальное число текстов в индексе.
+            seed (int): Начальное значение для хэш-функций.
+        """
+        if num_perm % bands:
+            raise ValueError(f"{num_perm} % {bands}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        generator = random.Random(seed)
+        self.permutations = [(generator.randrange(1, MERSENNE_PRIME),
+                              generator.randrange(MERSENNE_PRIME))
+                             for _ in range(num_perm)]
+
+        self.entries = OrderedDict()
+        self.buckets = {}
+        self.next_id = 0
+        self.hits = 0
+        self.misses = 0
+        self.reused = {}
+        self.recent = OrderedDict()
+        self._lock = threading.Lock()
+
+    def signature(self, text):
+        """
+        Вычисляет MinHash-подпись текста.
+
+        Подписи последних SIGNATURE_MEMO текстов запоминаются, поэтому
+        перевод и оценка тональности одного текста вычисляют подпись
+        один раз.
+
+        Args:
+            text (str): Исходный текст.
+
+        Returns:
+            tuple[int, ...] | None: Подпись или None, если в тексте
+                нет слов.
+        """
+        with self._lock:
+            if text in self.recent:
+                self.recent.move_to_end(text)
+                return self.recent[text]
+
+        hashes = [shingle_hash(shingle)
+                  for shingle in shingles(text, self.shingle_size)]
+        signature = tuple(
+            min((a * value + b) % MERSENNE_PRIME for value in hashes)
+            for a, b in self.permutations) if hashes else None
+
+        with self._lock:
+            self.recent[text] = signature
+            if len(self.recent) > SIGNATURE_MEMO:
+                self.recent.popitem(last=False)
+        return signature
+
+    def band_keys(self, signature):
+        """Возвращает ключи полос LSH для подписи."""
+        return [(band, signature[band * self.rows:(band + 1) * self.rows])
+                for band in range(self.bands)]
+
+    def similarity(self, first, second):
+        """
+        Оценивает сходство Жаккара по двум подписям.
+
+        Args:
+            first (tuple[int, ...]): Первая подпись.
+            second (tuple[int, ...]): Вторая подпись.
+
+        Returns:
+            float: Доля совпадающих элементов подписей.
+        """
+        return sum(a == b for a, b in zip(first, second)) / self.num_perm
+
+    def find(self, signature, kind):
+        """
+        Ищет наиболее похожий текст, для которого есть значение вида kind.
+
+        Вызывается под блокировкой.
+
+        Returns:
+            tuple[float, object] | None: Сходство и значение.
+        """
+        best = None
+        seen = set()
+        for key in self.band_keys(signature):
+            for entry_id in self.buckets.get(key, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                other, values = self.entries[entry_id]
+                if kind not in values:
+                    continue
+                score = self.similarity(signature, other)
+                if score >= self.threshold and (best is None
+                                                or score > best[0]):
+                    best = (score, values[kind])
+        return best
+
+    def get(self, text, kind, signature=None):
+        """
+        Возвращает значение, сохраненное для почти дубликата текста.
+
+        Args:
+            text (str): Исходный текст.
+            kind (str): Вид значения.
+            signature (tuple[int, ...] | None): Готовая подпись текста.
+
+        Returns:
+            object | None: Значение или None, если дубликата нет.
+        """
+        if signature is None:
+            signature = self.signature(text)
+        with self._lock:
+            found = self.find(signature, kind) if signature else None
+            if found is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.reused[kind] = self.reused.get(kind, 0) + 1
+        return found[1]
+
+    def group(self, texts, kind, signatures=None):
+        """
+        Находит почти дубликаты внутри списка текстов, не изменяя индекс.
+
+        Тексты, похожие на встреченные раньше в списке, учитываются как
+        переиспользованные значения вида kind.
+
+        Args:
+            texts (list[str]): Тексты.
+            kind (str): Вид значения.
+            signatures (list[tuple[int, ...] | None] | None): Готовые
+                подписи текстов.
+
+        Returns:
+            list[int]: Для каждого текста позиция первого похожего на него
+                текста списка (для первого в группе — его собственная).
+        """
+        if signatures is None:
+            signatures = [self.signature(text) for text in texts]
+        buckets = {}
+        groups = []
+        for position, signature in enumerate(signatures):
+            representative = position
+            if signature is not None:
+                keys = self.band_keys(signature)
+                candidates = set()
+                for key in keys:
+                    candidates.update(buckets.get(key, ()))
+                best = self.threshold
+                for candidate in sorted(candidates):
+                    score = self.similarity(signature, signatures[candidate])
+                    if score >= best and representative == position \
+                            or score > best:
+                        representative, best = candidate, score
+                if representative == position:
+                    for key in keys:
+                        buckets.setdefault(key, []).append(position)
+            groups.append(representative)
+
+        duplicates = sum(representative != position
+                         for position, representative in enumerate(groups))
+        with self._lock:
+            self.hits += duplicates
+            self.misses -= duplicates
+            if duplicates:
+                self.reused[kind] = self.reused.get(kind, 0) + duplicates
+        return groups
+
+    def add(self, text, kind, value, signature=None):
+        """
+        Сохраняет значение для текста.
+
+        Args:
+            text (str): Исходный текст.
+            kind (str): Вид значения.
+            value: Значение, например перевод или оценка тональности.
+            signature (tuple[int, ...] | None): Готовая подпись текста.
+        """
+        if signature is None:
+            signature = self.signature(text)
+        if signature is None:
+            return
+        keys = self.band_keys(signature)
+        with self._lock:
+            for entry_id in self.buckets.get(keys[0], ()):
+                other, values = self.entries[entry_id]
+                if other == signature:
+                    values[kind] = value
+                    return
+
+            entry_id = self.next_id
+            self.next_id += 1
+            self.entries[entry_id] = (signature, {kind: value})
+            for key in keys:
+                self.buckets.setdefault(key, set()).add(entry_id)
+            if self.max_entries is not None \
+                    and len(self.entries) > self.max_entries:
+                self.evict()
+
+    def evict(self):
+        """Вытесняет самый старый текст. Вызывается под блокировкой."""
+        entry_id, (signature, _) = self.entries.popitem(last=False)
+        for key in self.band_keys(signature):
+            bucket = self.buckets[key]
+            bucket.discard(entry_id)
+            if not bucket:
+                del self.buckets[key]
+
+    def stats(self):
+        """
+        Возвращает счетчики индекса.
+
+        Returns:
+            dict: Попадания, промахи, доля переиспользования (reuse_ratio),
+                число переиспользований по видам и размер индекса.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reuse_ratio": self.hits / total if total else 0.0,
+                "reused": dict(self.reused),
+                "size": len(self.entries),
+            }
+
+    def clear(self):
+        """Очищает индекс и счетчики."""
+        with self._lock:
+            self.entries.clear()
+            self.buckets.clear()
+            self.recent.clear()
+            self.hits = 0
+            self.misses = 0
+            self.reused.clear()
@@ -9,8 +9,7 @@ SENTENCES = "Количество предложений"
 LANGUAGE = "Язык"
 FRE_INDEX = "Индекс читаемости (FRE)"
 
-SIMPLE = "Текст очень легко читается 
-(для младших школьников)."
+SIMPLE = "Текст очень легко читается (для младших школьников)."
 MEDIUM = "Простой текст (для школьников)."
 HARD = "Текст немного трудно читать (для студентов)."
 IMPOSSIBLE = "Текст трудно читается (для выпускников ВУЗов)."
@@ -18,3 +17,51 @@ IMPOSSIBLE = "Текст трудно читается (для выпускни
 POSITIVE = "Позитивная"
 NEGATIVE = "Негативная"
 NEUTRAL = "Нейтральная"
+
+BULK_DESCRIPTION = "Пакетный анализ корпусов текстов."
+BULK_INPUTS = "Файлы, каталоги, JSONL или CSV; '-' для стандартного ввода."
+BULK_OUTPUT = "Файл для результатов; по умолчанию стандартный вывод."
+BULK_FORMAT = "Формат вывода: jsonl или parquet."
+BULK_WORKERS = "Количество процессов; по умолчанию число ядер."
+BULK_CHUNK_SIZE = "Количество документов в одном пакете."
+BULK_FIELD = "Имя поля с текстом в JSONL и CSV."
+BULK_NO_SENTIMENT = "Не оценивать тональность (без обращения к переводчику)."
+BULK_NO_PARQUET = "Для вывода в parquet требуется пакет pyarrow."
+BULK_PARQUET_OUTPUT = "Для формата parquet необходимо указать --output."
+BULK_OFFLINE = "Оценивать тональность локально, без перевода."
+BULK_STORE = "Файл хранилища результатов для повторных запусков."
+BULK_NOT_TEXT = "Поле с текстом отсутствует или не является строкой."
+BULK_BAD_JSON = "Строка JSONL не разбирается: {}"
+BULK_NOT_OBJECT = "Строка JSONL не является объектом."
+
+BENCH_DESCRIPTION = "Замеры производительности функций анализа текста."
+BENCH_SIZES = "Размеры синтетических текстов в байтах."
+BENCH_LATENCY = "Задержка заглушки переводчика в секундах."
+BENCH_SENTIMENT_LIMIT = "Максимальный размер текста для analyze_sentiment."
+BENCH_FUNCTIONS = "Имена функций для замера; по умолчанию все."
+BENCH_IMPORTS = "Замерить время импорта модулей вместо функций."
+BENCH_IMPORT_BUDGET = ("Допустимое время импорта в миллисекундах; при "
+                       "превышении или загрузке тяжелых модулей "
+                       "завершиться с ошибкой.")
+BENCH_IMPORT_OVER = ("Импорт {module} занял {seconds:.3f} с, "
+                     "загружены: {heavy_modules}")
+
+SERVER_DESCRIPTION = "HTTP-сервер анализа текста."
+SERVER_HOST = "Адрес для прослушивания."
+SERVER_PORT = "Порт."
+SERVER_WINDOW = "Время ожидания пакета запросов в секундах."
+SERVER_BATCH_SIZE = "Максимальное количество запросов в пакете."
+HTTP_NOT_FOUND = "Неизвестный адрес."
+HTTP_METHOD = "Поддерживается только метод POST."
+HTTP_BAD_REQUEST = "Ожидается JSON вида {\"text\": \"...\"}."
+HTTP_TOO_LARGE = "Слишком большой запрос."
+SERVER_PROFILE = "Включить замеры этапов анализа (GET /metrics)."
+
+PROFILE_STAGE = "Этап"
+PROFILE_CALLS = "Вызовы"
+PROFILE_TOTAL_MS = "Всего, мс"
+PROFILE_MEAN_US = "Среднее, мкс"
+PROFILE_BYTES = "Байты"
+PROFILE_HELP_CALLS = "Количество вызовов этапа."
+PROFILE_HELP_SECONDS = "Суммарное время этапа в секундах."
+PROFILE_HELP_BYTES = "Объем обработанного текста в байтах."
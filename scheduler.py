@@ -0,0 +1,225 @@
+from deep_translator.exceptions import TooManyRequests
+import random
+import threading
+import time
+import requests
+
+
+THROTTLE_ERRORS = (TooManyRequests, requests.Timeout,
+                   requests.ConnectionError, TimeoutError)
+
+
+def is_congestion(error, retry_on=THROTTLE_ERRORS):
+    """
+    Проверяет, означает ли ошибка перегрузку сервиса.
+
+    Перегрузкой считаются исключения retry_on и ответы с кодом 429 или
+    5xx, если исключение сообщает код в атрибуте status_code или
+    response.status_code. Остальные ошибки запроса, в том числе 4xx
+    и deep_translator.exceptions.RequestError без кода, перегрузкой
+    не считаются и не повторяются.
+
+    Args:
+        error (BaseException): Исключение запроса.
+        retry_on (tuple[type]): Исключения, всегда означающие перегрузку.
+
+    Returns:
+        bool: True, если запрос стоит повторить позже.
+    """
+    if isinstance(error, retry_on):
+        return True
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code',
+                         None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class TranslationScheduler:
+    """
+    Планировщик запросов к переводчику с учетом ограничений скорости.
+
+    Запросы проходят через маркерное ведро (не более rate запросов
+    в секунду, всплеск до burst) и ограничение числа одновременных
+    запросов. Ограничение подстраивается по схеме AIMD: растет на 1
+    за каждые limit успешных запросов и уменьшается вдвое при отказе
+    из-за перегрузки (429, 5xx, тайм-аут, ошибка соединения; см.
+    is_congestion), но не чаще раза за окно перегрузки: отказы запросов,
+    начатых до последнего уменьшения, его не повторяют. Такие запросы
+    повторяются с экспоненциальной задержкой со случайным разбросом.
+    """
+
+    def __init__(self, rate=5.0, burst=5, max_concurrency=16,
+                 min_concurrency=1, max_retries=5, base_delay=0.5,
+                 max_delay=30.0, retry_on=THROTTLE_ERRORS):
+        """
+        Args:
+            rate (float): Допустимое число запросов в секунду.
+            burst (int): Размер ведра маркеров.
+            max_concurrency (int): Верхняя граница одновременных запросов.
+            min_concurrency (int): Нижняя граница одновременных запросов.
+            max_retries (int): Число повторов одного запроса.
+            base_delay (float): Начальная задержка повтора в секундах.
+            max_delay (float): Наибольшая задержка повтора в секундах.
+            retry_on (tuple[type]): Исключения, всегда означающие
+                перегрузку; кроме них перегрузкой считаются ответы 429
+                и 5xx (см. is_congestion).
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+        self.limit = float(max_concurrency)
+        self.epoch = 0
+        self.tokens = float(burst)
+        self.refilled = time.monotonic()
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.condition = threading.Condition()
+
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def refill(self, now):
+        """Добавляет маркеры, накопившиеся с прошлого пополнения."""
+        self.tokens = min(self.burst,
+                          self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+
+    def acquire(self):
+        """
+        Ждет свободного слота и маркера.
+
+        Returns:
+            tuple[float, int]: Время ожидания в секундах и номер окна
+                перегрузки, в котором начат запрос (для release).
+        """
+        start = time.monotonic()
+        with self.condition:
+            self.queue_depth += 1
+            while True:
+                now = time.monotonic()
+                self.refill(now)
+                if self.in_flight < int(self.limit) and self.tokens >= 1:
+                    break
+                if self.in_flight >= int(self.limit):
+                    self.condition.wait()
+                else:
+                    self.condition.wait((1 - self.tokens) / self.rate)
+
+            self.tokens -= 1
+            self.in_flight += 1
+            self.queue_depth -= 1
+            self.requests += 1
+
+            waited = time.monotonic() - start
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            epoch = self.epoch
+        return waited, epoch
+
+    def release(self, throttled, epoch=None):
+        """
+        Освобождает слот и подстраивает ограничение одновременности.
+
+        Args:
+            throttled (bool): Запрос отклонен из-за перегрузки.
+            epoch (int | None): Номер окна перегрузки из acquire; если
+                ограничение уже уменьшено после начала запроса, отказ
+                его больше не уменьшает. None означает текущее окно.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                if epoch is None or epoch == self.epoch:
+                    self.limit = max(self.min_concurrency, self.limit / 2)
+                    self.epoch += 1
+            else:
+                self.limit = min(self.max_concurrency,
+                                 self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+    def backoff(self, attempt):
+        """
+        Вычисляет задержку перед повтором.
+
+        Args:
+            attempt (int): Номер повтора, начиная с 0.
+
+        Returns:
+            float: Задержка в секундах.
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, function, *args, **kwargs):
+        """
+        Выполняет запрос с учетом ограничений и повторов.
+
+        Args:
+            function (Callable): Функция, выполняющая запрос.
+            *args: Позиционные аргументы функции.
+            **kwargs: Именованные аргументы функции.
+
+        Returns:
+            Результат функции.
+
+        Raises:
+            Exception: Исключение функции, если повторы исчерпаны
+                или ошибка не связана с перегрузкой.
+        """
+        attempt = 0
+        while True:
+            _, epoch = self.acquire()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:
+                throttled = is_congestion(error, self.retry_on)
+                self.release(throttled, epoch)
+                if not throttled or attempt >= self.max_retries:
+                    with self.condition:
+                        self.failures += 1
+                    raise
+            else:
+                self.release(False, epoch)
+                return result
+
+            with self.condition:
+                self.retries += 1
+            time.sleep(self.backoff(attempt))
+            attempt += 1
+
+    def metrics(self):
+        """
+        Возвращает показатели планировщика.
+
+        Returns:
+            dict: Глубина очереди, число запросов в работе, текущее
+                ограничение одновременности, счетчики запросов, повторов,
+                отказов и время ожидания.
+        """
+        with self.condition:
+            acquired = self.requests
+            return {
+                "queue_depth": self.queue_depth,
+                "in_flight": self.in_flight,
+                "concurrency_limit": self.limit,
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "failures": self.failures,
+                "wait_time_total": self.wait_total,
+                "wait_time_max": self.wait_max,
+                "wait_time_mean": self.wait_total / acquired
+                if acquired else 0.0,
+            }
@@ -0,0 +1,333 @@
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import json
+from analyzer import get_analyzer
+from main import analyze_sentiment_many, readability
+import instrumentation
+import ru_local as ru
+
+
+BATCH_WINDOW = 0.005
+BATCH_SIZE = 64
+MAX_BODY = 10 * 1024 * 1024
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class MicroBatcher:
+    """
+    Собирает одновременные запросы в пакеты и обрабатывает каждый пакет
+    одним вызовом.
+
+    Пакет отправляется, когда в нем набралось max_items элементов или
+    с момента прихода первого элемента прошло window секунд. Если
+    обработка пакета завершилась ошибкой, элементы обрабатываются
+    по одному, и ошибку получают только те, на которых она повторилась.
+    """
+
+    def __init__(self, process, window=BATCH_WINDOW, max_items=BATCH_SIZE,
+                 executor=None):
+        """
+        Args:
+            process (Callable[[list], list]): Блокирующая функция,
+                обрабатывающая список элементов и возвращающая список
+                результатов того же размера.
+            window (float): Время ожидания пакета в секундах.
+            max_items (int): Максимальный размер пакета.
+            executor (Executor | None): Пул для вызова process.
+        """
+        self.process = process
+        self.window = window
+        self.max_items = max_items
+        self.executor = executor
+        self.pending = []
+        self.timer = None
+        self.batches = 0
+        self.items = 0
+        self.split_batches = 0
+
+    async def submit(self, item):
+        """
+        Добавляет элемент в текущий пакет и ждет результата.
+
+        Args:
+            item: Элемент для обработки.
+
+        Returns:
+            Результат обработки элемента.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((item, future))
+
+        if len(self.pending) >= self.max_items:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(
+                self.window, self.flush)
+        return await future
+
+    def flush(self):
+        """Отправляет накопленный пакет на обработку."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, []
+        self.batches += 1
+        self.items += len(batch)
+        asyncio.ensure_future(self.run(batch))
+
+    async def run(self, batch):
+        """
+        Обрабатывает пакет и передает результаты ожидающим запросам.
+
+        Args:
+            batch (list[tuple[object, asyncio.Future]]): Элементы пакета.
+        """
+        items = [item for item, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.process, items)
+        except Exception as error:
+            if len(batch) > 1:
+                self.split_batches += 1
+                await asyncio.gather(*(self.run([entry]) for entry in batch))
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self):
+        """
+        Возвращает счетчики пакетов.
+
+        Returns:
+            dict: Количество пакетов, элементов, средний размер пакета
+                и число пакетов, разобранных по одному элементу из-за
+                ошибки.
+        """
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "split_batches": self.split_batches,
+            "mean_batch_size": self.items / self.batches
+            if self.batches else 0.0,
+        }
+
+
+class AnalysisServer:
+    """
+    HTTP-сервер анализа текста на asyncio.
+
+    Принимает POST-запросы с телом {"text": "..."} на /analyze,
+    /readability и /sentiment и отвечает JSON; GET /metrics отдает
+    замеры instrumentation в формате Prometheus. Запросы тональности
+    объединяются в пакеты MicroBatcher, поэтому одновременные запросы
+    переводятся одним обращением к переводчику и оцениваются одним
+    проходом TextBlob.
+    """
+
+    def __init__(self, window=BATCH_WINDOW, max_items=BATCH_SIZE,
+                 workers=8):
+        """
+        Args:
+            window (float): Время ожидания пакета в секундах.
+            max_items (int): Максимальный размер пакета.
+            workers (int): Количество потоков для пакетной обработки.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.sentiment = MicroBatcher(analyze_sentiment_many, window,
+                                      max_items, self.executor)
+        self.routes = {
+            '/analyze': self.handle_analyze,
+            '/readability': self.handle_readability,
+            '/sentiment': self.handle_sentiment,
+        }
+
+    async def compute_readability(self, text):
+        """
+        Вычисляет метрики читаемости в пуле потоков, чтобы длинный текст
+        не блокировал цикл событий.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, readability, text)
+
+    async def handle_analyze(self, text):
+        """Тональность и метрики читаемости текста."""
+        sentiment, metrics = await asyncio.gather(
+            self.sentiment.submit(text), self.compute_readability(text))
+        result = dict(sentiment)
+        result.update(metrics)
+        return result
+
+    async def handle_readability(self, text):
+        """Метрики читаемости текста."""
+        return await self.compute_readability(text)
+
+    async def handle_sentiment(self, text):
+        """Тональность текста."""
+        return await self.sentiment.submit(text)
+
+    async def handle(self, reader, writer):
+        """
+        Обслуживает одно соединение, поддерживая keep-alive.
+
+        Args:
+            reader (asyncio.StreamReader): Входной поток.
+            writer (asyncio.StreamWriter): Выходной поток.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, path, version = request_line.decode(
+                    'latin-1').split(maxsplit=2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY:
+                    await self.respond(writer, 413,
+                                       {"error": ru.HTTP_TOO_LARGE})
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close' \
+                    and version.strip().upper() == 'HTTP/1.1'
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """
+        Выполняет запрос.
+
+        Args:
+            method (str): HTTP-метод.
+            path (str): Путь запроса.
+            body (bytes): Тело запроса.
+
+        Returns:
+            tuple[int, dict | str]: Код ответа и тело ответа.
+        """
+        path = path.split('?', 1)[0]
+        if path == '/metrics' and method == 'GET':
+            return 200, instrumentation.prometheus()
+
+        handler = self.routes.get(path)
+        if handler is None:
+            return 404, {"error": ru.HTTP_NOT_FOUND}
+        if method != 'POST':
+            return 405, {"error": ru.HTTP_METHOD}
+
+        try:
+            text = json.loads(body)['text']
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": ru.HTTP_BAD_REQUEST}
+        if not isinstance(text, str):
+            return 400, {"error": ru.HTTP_BAD_REQUEST}
+
+        try:
+            return 200, await handler(text)
+        except Exception as error:
+            return 500, {"error": str(error)}
+
+    async def respond(self, writer, status, payload, keep_alive=False):
+        """
+        Отправляет ответ: словарь — как JSON, строку — как обычный текст.
+
+        Args:
+            writer (asyncio.StreamWriter): Выходной поток.
+            status (int): Код ответа.
+            payload (dict | str): Тело ответа.
+            keep_alive (bool): Оставить соединение открытым.
+        """
+        if isinstance(payload, str):
+            body = payload.encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        """
+        Запускает сервер и обслуживает запросы до остановки.
+
+        Args:
+            host (str): Адрес для прослушивания.
+            port (int): Порт.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def run(argv=None):
+    """
+    Точка входа командной строки: python -m server.
+
+    Args:
+        argv (list[str] | None): Аргументы командной строки.
+    """
+    parser = argparse.ArgumentParser(prog='server',
+                                     description=ru.SERVER_DESCRIPTION)
+    parser.add_argument('--host', default='127.0.0.1', help=ru.SERVER_HOST)
+    parser.add_argument('-p', '--port', type=int, default=8000,
+                        help=ru.SERVER_PORT)
+    parser.add_argument('--window', type=float, default=BATCH_WINDOW,
+                        help=ru.SERVER_WINDOW)
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=ru.SERVER_BATCH_SIZE)
+    parser.add_argument('--profile', action='store_true',
+                        help=ru.SERVER_PROFILE)
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        instrumentation.enable()
+    get_analyzer()
+
+    server = AnalysisServer(args.window, args.batch_size)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    run()
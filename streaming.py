@@ -0,0 +1,185 @@
+import codecs
+import mmap
+import os
+from main import LANGUAGE_SAMPLE, TextStats, detect_language
+from syllables import count_text_syllables
+from tokenizer import (SENTENCE_END, count_sentences, count_vowels,
+                       count_words, last_sentence_end, word_tail)
+
+
+CHUNK_SIZE = 1 << 20
+# Хвост слова длиннее этого предела учитывается сразу, чтобы память
+# и время не зависели от длины текста без пробелов и знаков.
+MAX_PARTIAL_WORD = 1 << 12
+
+
+class StreamStats(TextStats):
+    """
+    Статистика текста, который поступает частями.
+
+    Хранит только счетчики и состояние на границе частей, поэтому
+    объем памяти не зависит от размера текста. Слово или предложение,
+    разрезанное границей частей, считается один раз; слоги слова длиннее
+    MAX_PARTIAL_WORD символов считаются по его частям.
+
+    Attributes:
+        words (int): Количество слов.
+        vowels (int): Количество гласных.
+        syllables (int): Количество слогов.
+        sentences (int): Количество предложений.
+        language (str): Язык текста (см. detect_language).
+    """
+
+    def __init__(self):
+        self.words = 0
+        self.vowels = 0
+        self.sentences = 0
+        self.counted_syllables = 0
+        self.partial_word = ''
+        self.sample = ''
+        self.in_word = False
+        self.open_sentence = False
+
+    @property
+    def language(self):
+        return detect_language(self.sample) if self.words else 'ENG'
+
+    @property
+    def syllables(self):
+        return self.counted_syllables + count_text_syllables(self.partial_word)
+
+    def feed(self, chunk):
+        """
+        Учитывает очередную часть текста.
+
+        Args:
+            chunk (str): Часть текста.
+        """
+        if not chunk:
+            return
+
+        words = count_words(chunk)
+        if self.in_word and not chunk[0].isspace():
+            words -= 1
+        self.words += words
+        self.in_word = not chunk[-1].isspace()
+
+        sentences = count_sentences(chunk)
+        if self.open_sentence:
+            match = SENTENCE_END.search(chunk)
+            head = chunk[:match.start()] if match else chunk
+            if head.strip():
+                sentences -= 1
+        self.sentences += sentences
+
+        last = last_sentence_end(chunk)
+        if last >= 0:
+            self.open_sentence = bool(chunk[last + 1:].strip())
+        elif chunk.strip():
+            self.open_sentence = True
+
+        self.vowels += count_vowels(chunk)
+
+        text = self.partial_word + chunk
+        tail = word_tail(text, MAX_PARTIAL_WORD)
+        self.partial_word = text[tail:]
+        self.counted_syllables += count_text_syllables(text[:tail])
+
+        if len(self.sample) < LANGUAGE_SAMPLE:
+            self.sample += chunk[:LANGUAGE_SAMPLE - len(self.sample)]
+
+
+def stream_stats(chunks):
+    """
+    Собирает статистику текста по итератору его частей.
+
+    Args:
+        chunks (Iterable[str]): Части текста.
+
+    Returns:
+        StreamStats: Статистика текста.
+    """
+    stats = StreamStats()
+    for chunk in chunks:
+        stats.feed(chunk)
+    return stats
+
+
+def read_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    Читает открытый текстовый файл частями.
+
+    Args:
+        file: Открытый текстовый поток.
+        chunk_size (int): Размер части в символах.
+
+    Yields:
+        str: Очередная часть текста.
+    """
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def file_stats(path, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Собирает статистику текстового файла за один проход, не загружая
+    его в память целиком.
+
+    Args:
+        path (str): Путь к файлу.
+        chunk_size (int): Размер части в символах.
+        encoding (str): Кодировка файла.
+
+    Returns:
+        StreamStats: Статистика текста.
+    """
+    with open(path, encoding=encoding) as file:
+        return stream_stats(read_chunks(file, chunk_size))
+
+
+def mmap_chunks(path, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Отображает файл в память и декодирует его по частям.
+
+    Многобайтовый символ, разрезанный границей части, декодируется
+    целиком в следующей части.
+
+    Args:
+        path (str): Путь к файлу.
+        chunk_size (int): Размер части в байтах.
+        encoding (str): Кодировка файла.
+
+    Yields:
+        str: Очередная часть текста.
+    """
+    if os.path.getsize(path) == 0:
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        size = len(mapped)
+        for start in range(0, size, chunk_size):
+            end = min(start + chunk_size, size)
+            chunk = decoder.decode(mapped[start:end], final=end == size)
+            if chunk:
+                yield chunk
+
+
+def mmap_stats(path, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Собирает статистику файла, отображенного в память, без чтения его
+    в одну строку.
+
+    Args:
+        path (str): Путь к файлу.
+        chunk_size (int): Размер части в байтах.
+        encoding (str): Кодировка файла.
+
+    Returns:
+        StreamStats: Статистика текста.
+    """
+    return stream_stats(mmap_chunks(path, chunk_size, encoding))
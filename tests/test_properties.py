@@ -0,0 +1,87 @@
+import random
+import pytest
+from incremental import IncrementalReadability
+from main import TextStats, fre_index, reading_difficulty
+from streaming import stream_stats
+from tokenizer import count_sentences, count_vowels, count_words
+
+
+ALPHABET = ("abcdefghijklmnopqrstuvwxyz ABCEOY "
+            "абвгдеёжзийклмнопрстуфхцчшщъыьэюя АЕЁИОУЫЭЮЯ "
+            "0123456789 _'’-,;:.!?… \n\n\t  ")
+WORDS = ("The quick brown fox. Jumps over!", "Привет, мир", "don't",
+         "Ёжик в тумане...", "It’s 42", "?!", "\n\n", "   ", "readability")
+
+
+def random_text(rng, size):
+    """Собирает текст из случайных символов и фрагментов слов."""
+    parts = []
+    while sum(map(len, parts)) < size:
+        if rng.random() < 0.3:
+            parts.append(rng.choice(WORDS))
+        else:
+            parts.append(''.join(rng.choice(ALPHABET)
+                                 for _ in range(rng.randint(1, 12))))
+    return ''.join(parts)[:size]
+
+
+def random_chunks(rng, text):
+    """Режет текст на части случайной длины, включая пустые."""
+    chunks = []
+    position = 0
+    while position < len(text):
+        size = rng.choice((0, 1, 2, 3, 7, 64, 500))
+        chunks.append(text[position:position + size])
+        position += size
+    return chunks
+
+
+def counts(stats):
+    return (stats.words, stats.vowels, stats.syllables, stats.sentences)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_stream_stats_matches_text_stats(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        text = random_text(rng, rng.randint(0, 400))
+        stats = stream_stats(random_chunks(rng, text))
+        expected = TextStats(text)
+        assert counts(stats) == counts(expected), text
+        assert stats.language == expected.language, text
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_incremental_readability_matches_text_stats(seed, monkeypatch):
+    rng = random.Random(seed)
+    monkeypatch.setattr('incremental.PAGE_SIZE', rng.choice((2, 3, 512)))
+    monkeypatch.setattr('incremental.split_blocks.__defaults__',
+                        (rng.choice((8, 32, 1024)),))
+    text = random_text(rng, rng.randint(0, 300))
+    document = IncrementalReadability(text)
+    for _ in range(60):
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, min(len(text), start + 50))
+        new = random_text(rng, rng.choice((0, 1, 5, 40)))
+        document.replace(start, end, new)
+        text = text[:start] + new + text[end:]
+
+        expected = TextStats(text)
+        assert document.text == text
+        assert len(document) == len(text)
+        assert counts(document) == counts(expected), text
+        assert document.language == expected.language, text
+        assert fre_index(document) == fre_index(text)
+        assert reading_difficulty(document) == reading_difficulty(text)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_count_batch_matches_tokenizer(seed):
+    vectorized = pytest.importorskip('vectorized')
+    rng = random.Random(seed)
+    texts = [random_text(rng, rng.randint(0, 300)) for _ in range(100)]
+    result = vectorized.count_batch(texts)
+    assert list(result['words']) == [count_words(text) for text in texts]
+    assert list(result['vowels']) == [count_vowels(text) for text in texts]
+    assert list(result['sentences']) == [count_sentences(text)
+                                         for text in texts]
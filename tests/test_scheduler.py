@@ -0,0 +1,177 @@
+from concurrent.futures import ThreadPoolExecutor
+import random
+import threading
+import pytest
+
+pytest.importorskip('deep_translator')
+from deep_translator.exceptions import RequestError, TooManyRequests
+import scheduler
+from scheduler import TranslationScheduler, is_congestion
+
+
+class ThrottlingStub:
+    """Заглушка сервиса, отвечающая 429 сверх capacity одновременных
+    запросов и на первые fail_first запросов."""
+
+    def __init__(self, capacity=None, fail_first=0, error=TooManyRequests):
+        self.capacity = capacity
+        self.fail_first = fail_first
+        self.error = error
+        self.active = 0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, text):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            overloaded = self.calls <= self.fail_first or (
+                self.capacity is not None and self.active > self.capacity)
+        try:
+            if overloaded:
+                raise self.error()
+            return text.upper()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class StatusError(RequestError):
+    def __init__(self, status_code):
+        super().__init__()
+        self.status_code = status_code
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(scheduler.time, 'sleep', delays.append)
+    return delays
+
+
+def make_scheduler(**kwargs):
+    options = dict(rate=1000.0, burst=1000, base_delay=0.5, max_delay=4.0)
+    options.update(kwargs)
+    return TranslationScheduler(**options)
+
+
+def test_retries_throttled_requests(sleeps):
+    stub = ThrottlingStub(fail_first=3)
+    jobs = make_scheduler()
+    assert jobs.call(stub, 'ok') == 'OK'
+    assert stub.calls == 4
+    assert len(sleeps) == 3
+    metrics = jobs.metrics()
+    assert metrics['retries'] == 3
+    assert metrics['throttled'] == 3
+    assert metrics['failures'] == 0
+
+
+def test_gives_up_after_max_retries(sleeps):
+    stub = ThrottlingStub(fail_first=100)
+    jobs = make_scheduler(max_retries=2)
+    with pytest.raises(TooManyRequests):
+        jobs.call(stub, 'ok')
+    assert stub.calls == 3
+    assert jobs.metrics()['failures'] == 1
+
+
+@pytest.mark.parametrize('status, retried', [(503, True), (500, True),
+                                             (429, True), (404, False),
+                                             (400, False)])
+def test_retries_only_congestion_statuses(sleeps, status, retried):
+    stub = ThrottlingStub(fail_first=1, error=lambda: StatusError(status))
+    jobs = make_scheduler()
+    if retried:
+        assert jobs.call(stub, 'ok') == 'OK'
+    else:
+        with pytest.raises(StatusError):
+            jobs.call(stub, 'ok')
+    assert stub.calls == (2 if retried else 1)
+    assert jobs.metrics()['throttled'] == (1 if retried else 0)
+    assert jobs.limit == (8.0 + 1 / 8.0 if retried else 16.0)
+
+
+def test_request_error_without_status_is_not_congestion():
+    assert not is_congestion(RequestError())
+    assert is_congestion(TooManyRequests())
+    assert is_congestion(TimeoutError())
+
+
+def test_backoff_is_capped(monkeypatch):
+    monkeypatch.setattr(scheduler.random, 'uniform',
+                        lambda low, high: high)
+    jobs = make_scheduler(base_delay=0.5, max_delay=4.0)
+    assert [jobs.backoff(attempt) for attempt in range(6)] == \
+        [0.5, 1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_backoff_delays_within_cap(sleeps):
+    random.seed(1)
+    stub = ThrottlingStub(fail_first=10)
+    jobs = make_scheduler(max_retries=10, base_delay=0.5, max_delay=2.0)
+    jobs.call(stub, 'ok')
+    assert len(sleeps) == 10
+    assert all(0 <= delay <= min(2.0, 0.5 * 2 ** attempt)
+               for attempt, delay in enumerate(sleeps))
+
+
+def test_limit_halves_once_per_congestion_window():
+    jobs = make_scheduler(max_concurrency=16, min_concurrency=1)
+    epochs = [jobs.acquire()[1] for _ in range(16)]
+    for epoch in epochs:
+        jobs.release(True, epoch)
+    assert jobs.limit == 8.0
+    assert jobs.metrics()['throttled'] == 16
+
+    _, epoch = jobs.acquire()
+    jobs.release(True, epoch)
+    assert jobs.limit == 4.0
+
+
+def test_limit_grows_additively_and_respects_bounds():
+    jobs = make_scheduler(max_concurrency=4, min_concurrency=2)
+    for _ in range(3):
+        _, epoch = jobs.acquire()
+        jobs.release(True, epoch)
+    assert jobs.limit == 2.0
+
+    for _ in range(2):
+        _, epoch = jobs.acquire()
+        jobs.release(False, epoch)
+    assert jobs.limit == pytest.approx(2.5 + 1 / 2.5)
+
+    for _ in range(100):
+        _, epoch = jobs.acquire()
+        jobs.release(False, epoch)
+    assert jobs.limit == 4.0
+
+
+def test_concurrent_burst_against_throttling_stub(sleeps):
+    stub = ThrottlingStub(capacity=4)
+    jobs = make_scheduler(max_concurrency=16, max_retries=100,
+                          base_delay=0.001, max_delay=0.001)
+    texts = [f"text {index}" for index in range(64)]
+    with ThreadPoolExecutor(16) as pool:
+        results = list(pool.map(lambda text: jobs.call(stub, text), texts))
+    assert results == [text.upper() for text in texts]
+
+    metrics = jobs.metrics()
+    assert metrics['requests'] == stub.calls
+    assert metrics['requests'] == len(texts) + metrics['retries']
+    assert metrics['throttled'] == metrics['retries']
+    assert metrics['failures'] == 0
+    assert metrics['in_flight'] == 0
+    assert metrics['queue_depth'] == 0
+    assert 1 <= metrics['concurrency_limit'] <= 16
+
+
+def test_metrics_report_waits():
+    jobs = make_scheduler(rate=1000.0, burst=1)
+    jobs.call(str, 'a')
+    jobs.call(str, 'b')
+    metrics = jobs.metrics()
+    assert metrics['requests'] == 2
+    assert metrics['wait_time_total'] >= metrics['wait_time_max'] > 0
+    assert metrics['wait_time_mean'] == \
+        pytest.approx(metrics['wait_time_total'] / 2)
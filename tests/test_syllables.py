@@ -0,0 +1,18 @@
+import pytest
+from syllables import count_syllables, english_syllables
+
+
+@pytest.mark.parametrize('word, syllables', [
+    ('makes', 1), ('times', 1), ('lines', 1), ('hopes', 1), ('loves', 1),
+    ('notes', 1), ('make', 1), ('boxes', 2), ('uses', 2), ('places', 2),
+    ('pages', 2), ('buzzes', 2), ('watches', 2), ('wishes', 2),
+    ('tables', 2), ('does', 1), ('goes', 1), ('recipes', 3),
+    ('ideas', 3), ('trees', 1), ('jumped', 1), ('wanted', 2),
+    ('little', 2), ('the', 1),
+])
+def test_english_syllables(word, syllables):
+    assert english_syllables(word) == syllables
+
+
+def test_russian_syllables_are_vowels():
+    assert count_syllables('Молоко') == 3
@@ -0,0 +1,207 @@
+import random
+import threading
+import pytest
+import main
+from main import (BATCH_SEPARATOR, chunk_text, pack_chunks, translate_chunk,
+                  translate_long, translate_many, translate_uncached)
+
+
+class StubService:
+    """
+    Заглушка переводчика: переводит каждую строку запроса отдельно и
+    запоминает запросы.
+
+    Attributes:
+        requests (list[str]): Тексты отправленных запросов.
+        merge_lines (bool): Склеивать строки ответа, как это иногда
+            делает настоящий переводчик.
+        fail_batches (bool): Отклонять запросы из нескольких строк.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.merge_lines = False
+        self.fail_batches = False
+        self.lock = threading.Lock()
+
+    def translate(self, text):
+        with self.lock:
+            self.requests.append(text)
+        lines = text.split(BATCH_SEPARATOR)
+        if self.fail_batches and len(lines) > 1:
+            raise RuntimeError('batch rejected')
+        translated = [f"<{line}>" for line in lines]
+        if self.merge_lines:
+            return ' '.join(translated)
+        return BATCH_SEPARATOR.join(translated)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = StubService()
+
+    class StubTranslator:
+        def __init__(self, source='auto', target='en'):
+            self.target = target
+
+        def translate(self, text, **kwargs):
+            return service.translate(text)
+
+    monkeypatch.setattr(main, 'translator_factory', StubTranslator)
+    monkeypatch.setattr(main, 'translation_cache', None)
+    monkeypatch.setattr(main, 'translation_scheduler', None)
+    monkeypatch.setattr(main, 'near_duplicates', None)
+    main.reset_translators()
+    yield service
+    main.reset_translators()
+
+
+def random_texts(rng, count, max_size):
+    alphabet = "abcdefgh ijk lmnop."
+    return [''.join(rng.choice(alphabet)
+                    for _ in range(rng.randint(1, max_size)))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_pack_chunks_respects_limit_and_covers_each_text(seed):
+    rng = random.Random(seed)
+    max_chars = rng.choice((20, 100, 500))
+    texts = random_texts(rng, 200, max_chars + 10)
+    texts[::17] = ['two\nlines'] * len(texts[::17])
+    pairs = list(enumerate(texts))
+
+    chunks = pack_chunks(pairs, max_chars)
+    assert sorted(pair for chunk in chunks for pair in chunk) == pairs
+    for chunk in chunks:
+        assert [index for index, _ in chunk] == \
+            sorted(index for index, _ in chunk)
+        if len(chunk) > 1:
+            joined = BATCH_SEPARATOR.join(text for _, text in chunk)
+            assert len(joined) < max_chars
+            assert not any(BATCH_SEPARATOR in text for _, text in chunk)
+        assert all(len(text) < max_chars for _, text in chunk) \
+            or len(chunk) == 1
+
+
+def test_pack_chunks_isolates_separator_and_oversized_texts():
+    pairs = [(0, 'a'), (1, 'b\nc'), (2, 'd'), (3, 'x' * 10), (4, 'e')]
+    assert pack_chunks(pairs, 10) == [[(1, 'b\nc')], [(3, 'x' * 10)],
+                                      [(0, 'a'), (2, 'd'), (4, 'e')]]
+
+
+def test_translate_chunk_sends_one_request(service):
+    chunk = [(5, 'un'), (2, 'deux'), (9, 'trois')]
+    assert translate_chunk(chunk) == ['<un>', '<deux>', '<trois>']
+    assert service.requests == ['un\ndeux\ntrois']
+
+
+def test_translate_chunk_falls_back_on_line_mismatch(service):
+    service.merge_lines = True
+    chunk = [(0, 'un'), (1, 'deux'), (2, 'trois')]
+    assert translate_chunk(chunk) == ['<un>', '<deux>', '<trois>']
+    assert service.requests == ['un\ndeux\ntrois', 'un', 'deux', 'trois']
+
+
+def test_translate_chunk_falls_back_on_error(service):
+    service.fail_batches = True
+    chunk = [(0, 'un'), (1, 'deux')]
+    assert translate_chunk(chunk) == ['<un>', '<deux>']
+    assert service.requests == ['un\ndeux', 'un', 'deux']
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_translate_many_maps_results_to_inputs(service, seed):
+    rng = random.Random(seed)
+    texts = random_texts(rng, 300, 80) + ['', '   ', 'a\nb']
+    rng.shuffle(texts)
+
+    results = translate_many(texts, 'en', max_chars=200)
+    for text, result in zip(texts, results):
+        if not text.strip():
+            assert result == text
+        else:
+            lines = text.split(BATCH_SEPARATOR)
+            assert result.split(BATCH_SEPARATOR) == \
+                [f"<{line}>" for line in lines]
+
+    pending = [(index, text) for index, text in enumerate(texts)
+               if text.strip()]
+    assert len(service.requests) == len(pack_chunks(pending, 200))
+    assert all(len(request) < 200 for request in service.requests)
+
+
+def test_translate_many_uses_cache(service, monkeypatch):
+    class DictCache(dict):
+        def get(self, text, source, target):
+            return super().get((text, source, target))
+
+        def set(self, text, source, target, translation):
+            self[(text, source, target)] = translation
+
+    monkeypatch.setattr(main, 'translation_cache', DictCache())
+    assert translate_many(['un', 'deux']) == ['<un>', '<deux>']
+    assert translate_many(['deux', 'un', 'trois']) == \
+        ['<deux>', '<un>', '<trois>']
+    assert service.requests == ['un\ndeux', 'trois']
+
+
+def long_text(rng, size):
+    sentences = []
+    while sum(map(len, sentences)) < size:
+        words = [''.join(rng.choice('abcdefghij')
+                         for _ in range(rng.randint(1, 9)))
+                 for _ in range(rng.randint(1, 30))]
+        sentences.append(' '.join(words) + rng.choice(('. ', '! ', '?\n')))
+    return ''.join(sentences)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_chunk_text_respects_limit_and_keeps_words(seed):
+    rng = random.Random(seed)
+    max_chars = rng.choice((40, 200, 5000))
+    text = long_text(rng, rng.choice((100, 3000, 20000)))
+    chunks = chunk_text(text, max_chars)
+    assert all(0 < len(chunk) < max_chars for chunk in chunks)
+    assert ''.join(chunks) == text
+
+
+def test_chunk_text_splits_long_sentences_and_words():
+    sentence = ' '.join(['word'] * 30) + '.'
+    chunks = chunk_text(sentence, 40)
+    assert len(chunks) > 1
+    assert all(len(chunk) < 40 for chunk in chunks)
+    assert ''.join(chunks) == sentence
+
+    text = f"Short. {'x' * 95} end."
+    chunks = chunk_text(text, 40)
+    assert all(len(chunk) < 40 for chunk in chunks)
+    assert ''.join(chunks) == text
+
+
+def test_translate_long_keeps_chunk_order(service, monkeypatch):
+    delays = random.Random(1)
+    original = service.translate
+
+    def translate(text):
+        threading.Event().wait(delays.random() / 500)
+        return original(text)
+
+    monkeypatch.setattr(service, 'translate', translate)
+    text = long_text(random.Random(2), 20000)
+    chunks = [chunk for chunk in chunk_text(text, 500) if chunk.strip()]
+    result = translate_long(text, 'en', max_chars=500)
+    assert result == ' '.join(original(chunk) for chunk in chunks)
+    assert sorted(service.requests) == sorted(chunks * 2)
+
+
+def test_translate_uncached_routes_long_text(service):
+    text = long_text(random.Random(3), 2 * main.MAX_TRANSLATION_CHARS)
+    translate_uncached(text)
+    assert len(service.requests) > 1
+    assert all(len(request) < main.MAX_TRANSLATION_CHARS
+               for request in service.requests)
+
+    service.requests.clear()
+    assert translate_uncached('court') == '<court>'
+    assert service.requests == ['court']
@@ -0,0 +1,119 @@
+import re
+
+
+VOWELS = 'aeiouyаоуыэиёеяю'
+# Символы, которые после lower() дают гласную: сами гласные, их
+# заглавные варианты и 'İ' (lower() дает 'i' с точкой сверху).
+VOWEL_CHARS = VOWELS + VOWELS.upper() + 'İ'
+SENTENCE_ENDINGS = '.!?'
+SENTENCE_END = re.compile(r'[.!?]+')
+SENTENCE_FRAGMENT = re.compile(r'[^\s.!?][^.!?]*')
+# Слово вместе с окружающими пробелами; склейка всех совпадений дает
+# исходную строку.
+WORD_SPAN = re.compile(r'\s*\S+\s*|\s+')
+WORD = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+# Символ, который не может входить в WORD: ни буква, ни апостроф.
+WORD_BREAK = re.compile(r"[^\w'’]|[\d_]")
+
+
+def count_words(text):
+    """
+    Подсчитывает количество слов в тексте.
+
+    Args:
+        text (str): Текст для подсчета.
+
+    Returns:
+        int: Количество слов.
+    """
+    return len(text.split())
+
+
+def count_vowels(text):
+    """
+    Подсчитывает количество гласных в тексте.
+
+    Каждая гласная считается отдельным вызовом str.count, что быстрее
+    посимвольного обхода и не создает копию текста в нижнем регистре.
+
+    Args:
+        text (str): Текст для подсчета.
+
+    Returns:
+        int: Количество гласных.
+    """
+    return sum(map(text.count, VOWEL_CHARS))
+
+
+def count_sentences(text):
+    """
+    Подсчитывает количество предложений в тексте.
+
+    Предложением считается фрагмент между знаками конца предложения,
+    содержащий хотя бы один непробельный символ.
+
+    Args:
+        text (str): Текст для подсчета.
+
+    Returns:
+        int: Количество предложений.
+    """
+    return sum(1 for _ in SENTENCE_FRAGMENT.finditer(text))
+
+
+def split_sentences(text):
+    """
+    Делит текст на предложения, сохраняя знаки препинания и пробелы,
+    так что склейка частей дает исходный текст.
+
+    Args:
+        text (str): Текст для разбиения.
+
+    Returns:
+        list[str]: Предложения в исходном порядке.
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def last_sentence_end(text):
+    """
+    Находит позицию последнего знака конца предложения.
+
+    Args:
+        text (str): Текст для поиска.
+
+    Returns:
+        int: Индекс знака или -1, если его нет.
+    """
+    return max(map(text.rfind, SENTENCE_ENDINGS))
+
+
+def word_tail(text, limit=None):
+    """
+    Находит начало хвоста текста из букв и апострофов, который может
+    продолжиться словом в следующей части текста.
+
+    Слова WORD состоят только из букв и апострофов, поэтому ни одно
+    слово не пересекает границу перед хвостом. Просматриваются только
+    последние limit + 1 символов.
+
+    Args:
+        text (str): Текст для поиска.
+        limit (int | None): Наибольшая длина хвоста.
+
+    Returns:
+        int: Индекс начала хвоста; len(text), если хвоста нет или он
+            длиннее limit.
+    """
+    window = text if limit is None else text[-(limit + 1):]
+    match = WORD_BREAK.search(window[::-1])
+    if match:
+        return len(text) - match.start()
+    return len(text) if len(window) < len(text) else 0
@@ -0,0 +1,133 @@
+from bs4 import BeautifulSoup
+from deep_translator import GoogleTranslator
+from deep_translator.exceptions import (RequestError, TooManyRequests,
+                                        TranslationNotFound)
+from deep_translator.validate import is_empty, is_input_valid
+from importlib.metadata import PackageNotFoundError, version
+
+
+# SessionTranslator повторяет GoogleTranslator.translate из этих версий
+# deep_translator (сверено с 1.11.4); с другими версиями используется
+# исходный класс. Версия берется из метаданных пакета: атрибут
+# deep_translator.__version__ в 1.11 не обновлен и равен "1.9.1".
+SUPPORTED_VERSIONS = ('1.11.',)
+
+
+class HTTPStatusError(RequestError):
+    """
+    Неуспешный ответ переводчика с кодом статуса, по которому
+    scheduler.is_congestion отличает перегрузку (5xx) от ошибок запроса.
+
+    Attributes:
+        status_code (int): Код статуса HTTP.
+    """
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class SessionTranslator(GoogleTranslator):
+    """
+    GoogleTranslator, отправляющий запросы через переданную
+    HTTP-сессию с пулом соединений.
+
+    Исходный класс вызывает requests.get модуля deep_translator.google
+    и открывает новое соединение на каждый запрос; подмена этого модуля
+    затронула бы все переводчики процесса. Подкласс выполняет тот же
+    запрос и разбор ответа, но через свою сессию, а на неуспешный ответ
+    вызывает HTTPStatusError с кодом статуса.
+    """
+
+    def __init__(self, source='auto', target='en', session=None, **kwargs):
+        """
+        Args:
+            source (str): Язык исходного текста.
+            target (str): Язык перевода.
+            session (requests.Session): HTTP-сессия для запросов.
+            **kwargs: Остальные параметры GoogleTranslator.
+        """
+        super().__init__(source=source, target=target, **kwargs)
+        self.session = session
+
+    def translate(self, text, **kwargs):
+        """
+        Переводит текст.
+
+        Args:
+            text (str): Текст не длиннее 5000 символов.
+
+        Returns:
+            str: Переведенный текст.
+
+        Raises:
+            NotValidPayload, NotValidLength: Недопустимый текст.
+            TooManyRequests: Ответ с кодом 429.
+            HTTPStatusError: Другой неуспешный ответ.
+            TranslationNotFound: В ответе нет перевода.
+        """
+        is_input_valid(text, max_chars=5000)
+        text = text.strip()
+        if self._same_source_target() or is_empty(text):
+            return text
+        self._url_params["tl"] = self._target
+        self._url_params["sl"] = self._source
+        if self.payload_key:
+            self._url_params[self.payload_key] = text
+
+        with self.session.get(self._base_url, params=self._url_params,
+                              proxies=self.proxies) as response:
+            if response.status_code == 429:
+                raise TooManyRequests()
+            if not 200 <= response.status_code < 300:
+                raise HTTPStatusError(response.status_code)
+            soup = BeautifulSoup(response.text, "html.parser")
+
+        element = soup.find(self._element_tag, self._element_query)
+        if not element:
+            element = soup.find(self._element_tag, self._alt_element_query)
+            if not element:
+                raise TranslationNotFound(text)
+
+        translation = element.get_text(strip=True)
+        if translation == text and any(char.isalnum() for char in text):
+            self._url_params["tl"] = self._target
+            if "hl" in self._url_params:
+                del self._url_params["hl"]
+                return self.translate(text)
+        return translation
+
+
+def installed_version():
+    """
+    Возвращает установленную версию deep_translator.
+
+    Returns:
+        str: Версия из метаданных пакета или пустая строка, если
+            метаданных нет.
+    """
+    try:
+        return version('deep-translator')
+    except PackageNotFoundError:
+        return ''
+
+
+def session_factory(session):
+    """
+    Возвращает фабрику переводчиков Google, использующих общую сессию.
+
+    Args:
+        session (requests.Session): HTTP-сессия с пулом соединений.
+
+    Returns:
+        Callable[..., GoogleTranslator]: SessionTranslator с привязанной
+            сессией или исходный GoogleTranslator, если установленная
+            версия deep_translator не входит в SUPPORTED_VERSIONS.
+    """
+    if not installed_version().startswith(SUPPORTED_VERSIONS):
+        return GoogleTranslator
+
+    def create(source='auto', target='en', **kwargs):
+        return SessionTranslator(source, target, session=session, **kwargs)
+
+    return create
@@ -0,0 +1,187 @@
+import numpy as np
+from tokenizer import SENTENCE_ENDINGS, VOWELS
+
+
+TABLE_SIZE = 0x10000
+
+
+def build_table(predicate):
+    """
+    Строит таблицу поиска по кодам символов базовой плоскости Unicode.
+
+    Args:
+        predicate (Callable[[str], bool]): Условие для символа.
+
+    Returns:
+        numpy.ndarray: Булев массив длины TABLE_SIZE.
+    """
+    return np.fromiter((predicate(chr(code)) for code in range(TABLE_SIZE)),
+                       dtype=bool, count=TABLE_SIZE)
+
+
+VOWEL_TABLE = build_table(
+    lambda char: any(letter in VOWELS for letter in char.lower()))
+SPACE_TABLE = build_table(str.isspace)
+SENTENCE_END_TABLE = build_table(lambda char: char in SENTENCE_ENDINGS)
+
+
+def encode_batch(texts):
+    """
+    Кодирует тексты в общий буфер кодов символов.
+
+    Args:
+        texts (list[str]): Тексты.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Буфер кодов uint32 и массив
+            смещений длины len(texts) + 1, где текст i занимает
+            codes[offsets[i]:offsets[i + 1]].
+    """
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32)
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(text) for text in texts], out=offsets[1:])
+    return codes, offsets
+
+
+def lookup(table, codes):
+    """
+    Применяет таблицу поиска к буферу кодов; символы за пределами
+    базовой плоскости считаются не подходящими под условие.
+
+    Args:
+        table (numpy.ndarray): Таблица поиска.
+        codes (numpy.ndarray): Буфер кодов символов.
+
+    Returns:
+        numpy.ndarray: Булев массив той же длины, что и codes.
+    """
+    return table[np.where(codes < TABLE_SIZE, codes, 0)]
+
+
+def segment_sums(mask, offsets):
+    """
+    Суммирует булев массив по отрезкам текстов.
+
+    Args:
+        mask (numpy.ndarray): Булев массив по символам буфера.
+        offsets (numpy.ndarray): Смещения текстов.
+
+    Returns:
+        numpy.ndarray: Суммы для каждого текста.
+    """
+    totals = np.zeros(len(mask) + 1, dtype=np.int64)
+    np.cumsum(mask, out=totals[1:])
+    return totals[offsets[1:]] - totals[offsets[:-1]]
+
+
+def vowels_from_codes(codes, offsets):
+    """
+    Подсчитывает гласные по буферу кодов символов.
+
+    Args:
+        codes (numpy.ndarray): Буфер кодов символов.
+        offsets (numpy.ndarray): Смещения текстов.
+
+    Returns:
+        numpy.ndarray: Количество гласных для каждого текста.
+    """
+    return segment_sums(lookup(VOWEL_TABLE, codes), offsets)
+
+
+def words_from_codes(codes, offsets):
+    """
+    Подсчитывает слова по буферу кодов символов.
+
+    Args:
+        codes (numpy.ndarray): Буфер кодов символов.
+        offsets (numpy.ndarray): Смещения текстов.
+
+    Returns:
+        numpy.ndarray: Количество слов для каждого текста.
+    """
+    space = lookup(SPACE_TABLE, codes)
+    previous_space = np.empty_like(space)
+    previous_space[1:] = space[:-1]
+    previous_space[offsets[:-1][offsets[:-1] < len(space)]] = True
+    return segment_sums(~space & previous_space, offsets)
+
+
+def sentences_from_codes(codes, offsets):
+    """
+    Подсчитывает предложения по буферу кодов символов.
+
+    Args:
+        codes (numpy.ndarray): Буфер кодов символов.
+        offsets (numpy.ndarray): Смещения текстов.
+
+    Returns:
+        numpy.ndarray: Количество предложений для каждого текста.
+    """
+    positions = np.flatnonzero(~lookup(SPACE_TABLE, codes))
+    terminator = lookup(SENTENCE_END_TABLE, codes[positions])
+    owner = np.searchsorted(offsets, positions, side='right') - 1
+
+    previous_terminator = np.ones_like(terminator)
+    previous_terminator[1:] = terminator[:-1]
+    new_text = np.ones_like(terminator)
+    new_text[1:] = owner[1:] != owner[:-1]
+
+    starts = ~terminator & (previous_terminator | new_text)
+    return np.bincount(owner[starts], minlength=len(offsets) - 1)
+
+
+def count_vowels_batch(texts):
+    """
+    Подсчитывает количество гласных в каждом тексте.
+
+    Args:
+        texts (list[str]): Тексты для подсчета.
+
+    Returns:
+        numpy.ndarray: Количество гласных для каждого текста.
+    """
+    return vowels_from_codes(*encode_batch(texts))
+
+
+def count_words_batch(texts):
+    """
+    Подсчитывает количество слов в каждом тексте.
+
+    Args:
+        texts (list[str]): Тексты для подсчета.
+
+    Returns:
+        numpy.ndarray: Количество слов для каждого текста.
+    """
+    return words_from_codes(*encode_batch(texts))
+
+
+def count_sentences_batch(texts):
+    """
+    Подсчитывает количество предложений в каждом тексте.
+
+    Args:
+        texts (list[str]): Тексты для подсчета.
+
+    Returns:
+        numpy.ndarray: Количество предложений для каждого текста.
+    """
+    return sentences_from_codes(*encode_batch(texts))
+
+
+def count_batch(texts):
+    """
+    Подсчитывает слова, гласные и предложения, кодируя тексты один раз.
+
+    Args:
+        texts (list[str]): Тексты для подсчета.
+
+    Returns:
+        dict: Массивы words, vowels и sentences.
+    """
+    codes, offsets = encode_batch(texts)
+    return {
+        "words": words_from_codes(codes, offsets),
+        "vowels": vowels_from_codes(codes, offsets),
+        "sentences": sentences_from_codes(codes, offsets),
+    }